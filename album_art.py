@@ -1,8 +1,10 @@
 import datetime
+import hashlib
 import json
 import os
 import re
 import tempfile
+import time
 import unicodedata
 from collections import defaultdict
 from difflib import SequenceMatcher
@@ -25,11 +27,21 @@ LOG_FILE = os.path.join(os.path.dirname(__file__), "logs/album_art_skipped.log")
 MAX_RELEASE_GROUPS = 6
 MAX_RELEASES_PER_GROUP = 6
 MAX_TOTAL_CANDIDATES = 14
+ID3_PADDING_HEADROOM = 4096  # bytes reserved when a tag outgrows its padding
 
 _RELEASE_CACHE: dict[str, dict] = {}
 _CANDIDATE_CACHE: dict[tuple[str, str], list[dict]] = {}
 _COVER_ART_CACHE: dict[str, tuple[bytes, str, str]] = {}
 
+# Artwork already embedded for an (artist, album), so later tracks from the
+# same album skip the MusicBrainz search. Also kept on disk across runs;
+# entries older than the TTL are fetched again so upstream fixes are picked
+# up. Deleting the directory clears the cache.
+ALBUM_ART_CACHE_DIR = os.path.join(os.path.dirname(__file__), ".album_art_cache")
+ALBUM_ART_CACHE_TTL = 30 * 24 * 60 * 60
+_ALBUM_ART_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png"}
+_ALBUM_ART_CACHE: dict[tuple[str, str], tuple[bytes, str]] = {}
+
 
 def _log_line(message: str, *, prefix: str = "", icon: str | None = "ℹ️") -> None:
     symbol = f"{icon} " if icon else ""
@@ -48,6 +60,69 @@ def _log_skip(entry: dict):
         _log_line(f"Failed to write skip log: {e}", icon="⚠️")
 
 
+def _album_art_key(artist: str, album: str) -> tuple[str, str]:
+    return ((artist or "").strip().lower(), (album or "").strip().lower())
+
+
+def _album_art_disk_path(key: tuple[str, str], extension: str) -> str:
+    digest = hashlib.sha1("\x1f".join(key).encode("utf-8")).hexdigest()
+    return os.path.join(ALBUM_ART_CACHE_DIR, f"{digest}{extension}")
+
+
+def _load_album_art(key: tuple[str, str]) -> tuple[bytes, str] | None:
+    cached = _ALBUM_ART_CACHE.get(key)
+    if cached is not None:
+        return cached
+    now = time.time()
+    for mime_type, extension in _ALBUM_ART_EXTENSIONS.items():
+        path = _album_art_disk_path(key, extension)
+        try:
+            if now - os.path.getmtime(path) > ALBUM_ART_CACHE_TTL:
+                continue
+            with open(path, "rb") as f:
+                cached = (f.read(), mime_type)
+        except OSError:
+            continue
+        _ALBUM_ART_CACHE[key] = cached
+        return cached
+    return None
+
+
+def _remember_album_art(key: tuple[str, str], release_id: str) -> None:
+    art = _COVER_ART_CACHE.get(release_id)
+    if art is None:
+        return
+    image_data, mime_type, _ = art
+    _ALBUM_ART_CACHE[key] = (image_data, mime_type)
+    extension = _ALBUM_ART_EXTENSIONS.get(mime_type.split(";")[0].strip().lower())
+    if extension is None:  # Unusual formats are only cached for this run
+        return
+    tmp_path = None
+    try:
+        os.makedirs(ALBUM_ART_CACHE_DIR, exist_ok=True)
+        # Write then rename so concurrent taggers never read a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=ALBUM_ART_CACHE_DIR)
+        with os.fdopen(fd, "wb") as f:
+            f.write(image_data)
+        os.replace(tmp_path, _album_art_disk_path(key, extension))
+        tmp_path = None
+        # An expired copy in the other format would otherwise linger forever
+        for other_extension in _ALBUM_ART_EXTENSIONS.values():
+            if other_extension != extension:
+                try:
+                    os.remove(_album_art_disk_path(key, other_extension))
+                except FileNotFoundError:
+                    pass
+    except OSError as e:
+        _log_line(f"Failed to cache album art: {e}", icon="⚠️")
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
 def _parse_release_date(date_str: str) -> datetime.datetime:
     try:
         return datetime.datetime.strptime(date_str, "%Y-%m-%d")
@@ -520,6 +595,18 @@ def _download_cover_art(release_id: str, *, log_prefix: str = ""):
     return result
 
 
+def id3_padding(info) -> int:
+    """Padding callback for ID3.save that avoids rewriting the audio data.
+
+    Existing padding is kept whenever the new tag fits in it, so re-tagging
+    only rewrites the header. When the tag grows past it, some headroom is
+    reserved so the next edit fits without another full-file rewrite.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return ID3_PADDING_HEADROOM
+
+
 def _embed_image(mp3_path: str, image_data: bytes, mime_type: str):
     try:
         audio = ID3(mp3_path)
@@ -527,7 +614,7 @@ def _embed_image(mp3_path: str, image_data: bytes, mime_type: str):
         audio = ID3()
     audio.delall("APIC")
     audio.add(APIC(encoding=3, mime=mime_type, type=3, desc="Cover", data=image_data))
-    audio.save(mp3_path)
+    audio.save(mp3_path, padding=id3_padding)
 
 
 def embed_from_release_id(
@@ -672,6 +759,19 @@ def embed_from_artist_album(
     for the given artist and album. The search uses release-group heuristics plus a
     legacy exact-title fallback for safety.
     """
+    art_key = _album_art_key(artist, album)
+    cached_art = _load_album_art(art_key)
+    if cached_art is not None:
+        image_data, mime_type = cached_art
+        _embed_image(mp3_path, image_data, mime_type)
+        _log_line(
+            f"Embedded cached artwork for '{album}' into "
+            f"'{os.path.basename(mp3_path) or mp3_path}'",
+            icon="🎨",
+            prefix=log_prefix,
+        )
+        return
+
     detail_prefix = f"{log_prefix}   "
     _log_line(
         f"Searching for album '{album}' by '{artist}' on MusicBrainz...",
@@ -731,6 +831,7 @@ def embed_from_artist_album(
         if embed_from_release_id(
             mp3_path, release_id, release_title, log_prefix=detail_prefix
         ):
+            _remember_album_art(art_key, release_id)
             return
 
     legacy_success, legacy_info = _legacy_exact_match_attempt(
@@ -742,6 +843,8 @@ def embed_from_artist_album(
         log_prefix=detail_prefix,
     )
     if legacy_success:
+        # The release that worked is the last one the fallback attempted
+        _remember_album_art(art_key, attempted_release_ids[-1])
         return
 
     reason = "no_suitable_cover_art"
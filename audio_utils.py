@@ -3,21 +3,67 @@ from __future__ import annotations
 
 import os
 import subprocess
-from typing import Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence
 
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import APIC, ID3, ID3NoHeaderError, error
+from mutagen.apev2 import APENoHeaderError, APEv2
+from mutagen.id3 import (
+    APIC,
+    ID3,
+    TALB,
+    TCON,
+    TDRC,
+    TIT2,
+    TPE1,
+    ID3NoHeaderError,
+)
 
-from album_art import embed_from_artist_album
+from album_art import embed_from_artist_album, id3_padding
 
+# Files per mp3gain invocation; keeps each command line well under ARG_MAX
+MP3GAIN_BATCH_SIZE = 256
 
-def ensure_easyid3(path: str) -> EasyID3:
+
+def _load_id3(path: str) -> ID3:
+    """Load the file's ID3 tag, or a fresh one if it has none yet.
+
+    Corrupt tags raise instead of being silently replaced, so their frames
+    are never discarded by the following save.
+    """
     try:
-        return EasyID3(path)
+        return ID3(path)
     except ID3NoHeaderError:
-        tags = EasyID3()
-        tags.save(path)
-        return EasyID3(path)
+        return ID3()
+
+
+@lru_cache(maxsize=1)
+def _fallback_thumbnail() -> Optional[bytes]:
+    """Return the fallback cover art bytes, read from disk once per process."""
+    thumbnail_path = os.path.join(os.path.dirname(__file__), "Thumbnail_logo.png")
+    try:
+        with open(thumbnail_path, "rb") as img:
+            return img.read()
+    except FileNotFoundError:
+        return None
+
+
+def has_replaygain(path: str) -> bool:
+    """Return True when mp3gain (APEv2) or ID3 TXXX ReplayGain data is present."""
+    try:
+        if "REPLAYGAIN_TRACK_GAIN" in APEv2(path):
+            return True
+    except APENoHeaderError:
+        pass
+    except Exception:
+        return False
+
+    try:
+        frames = ID3(path).getall("TXXX")
+    except Exception:
+        return False
+    return any(frame.desc.upper() == "REPLAYGAIN_TRACK_GAIN" for frame in frames)
 
 
 def tag_mp3(
@@ -29,70 +75,146 @@ def tag_mp3(
     album: Optional[str] = None,
     *,
     log_prefix: str = "",
+    replaygain: bool = True,
 ):
+    """Write text tags and cover art to ``path``.
+
+    With ``replaygain=False`` normalization is left to the caller, which can
+    batch many files into one ``apply_replaygain`` call.
+    """
     file_name = os.path.basename(path)
     trimmed_album = str(album).strip() if album else ""
 
+    # Collect log lines and write them in one go; flushed before album-art
+    # lookups (which print on their own) so the output order is preserved.
+    pending_lines: List[str] = []
+    prefix = log_prefix or ""
+
     def _log(message: str) -> None:
-        prefix = log_prefix or ""
-        print(f"{prefix}{message}")
-
-    _log(
-        f"↻ Tagging '{file_name}' (artist: {artist}, title: {title}, year: {year}, genre: {genre})"
-    )
-    audio = ensure_easyid3(path)
-    audio["artist"] = artist
-    audio["title"] = title
-    audio["date"] = year
-    audio["genre"] = genre
-    if album and str(album).strip():
-        audio["album"] = str(album).strip()
-    audio.save()
-
-    if album and str(album).strip():
-        try:
-            _log("🎨 Embedding album art via MusicBrainz")
-            embed_from_artist_album(path, artist, trimmed_album, log_prefix=log_prefix)
-            _log("   ✓ Album art embedded")
-        except Exception as exc:
-            _log(f"⚠️ Failed to embed cover art from MusicBrainz: {exc}")
-    else:
-        try:
-            id3 = ID3(path)
-        except ID3NoHeaderError:
-            id3 = ID3()
-            id3.save(path)
-            id3 = ID3(path)
-        except error:
-            id3 = ID3()
-        thumbnail_path = os.path.join(os.path.dirname(__file__), "Thumbnail_logo.png")
-        if os.path.exists(thumbnail_path):
-            with open(thumbnail_path, "rb") as img:
-                id3.add(
-                    APIC(
-                        encoding=3,
-                        mime="image/png",
-                        type=3,
-                        desc="Cover",
-                        data=img.read(),
-                    )
-                )
-            id3.save(path)
-            _log("🎨 Attached fallback thumbnail art")
+        pending_lines.append(f"{prefix}{message}\n")
+
+    def _flush() -> None:
+        if pending_lines:
+            sys.stdout.write("".join(pending_lines))
+            pending_lines.clear()
+
+    try:
+        _log(
+            f"↻ Tagging '{file_name}' (artist: {artist}, title: {title}, year: {year}, genre: {genre})"
+        )
+        # Load the tag once and write text frames plus fallback art in one save,
+        # rather than parsing the file through EasyID3 and again through ID3.
+        id3 = _load_id3(path)
+        id3.add(TPE1(encoding=3, text=[artist]))
+        id3.add(TIT2(encoding=3, text=[title]))
+        id3.add(TDRC(encoding=3, text=[year]))
+        id3.add(TCON(encoding=3, text=[genre]))
+        if trimmed_album:
+            id3.add(TALB(encoding=3, text=[trimmed_album]))
+
+        if trimmed_album:
+            id3.save(path, padding=id3_padding)
+            try:
+                _log("🎨 Embedding album art via MusicBrainz")
+                _flush()
+                embed_from_artist_album(path, artist, trimmed_album, log_prefix=log_prefix)
+                _log("   ✓ Album art embedded")
+            except Exception as exc:
+                _log(f"⚠️ Failed to embed cover art from MusicBrainz: {exc}")
         else:
-            _log("🎨 No fallback thumbnail art available")
+            thumbnail_data = _fallback_thumbnail()
+            if thumbnail_data is not None:
+                existing_cover = id3.get("APIC:Cover")
+                if (
+                    existing_cover is not None
+                    and existing_cover.mime == "image/png"
+                    and existing_cover.data == thumbnail_data
+                ):
+                    _log("🎨 Fallback thumbnail art already embedded")
+                else:
+                    id3.add(
+                        APIC(
+                            encoding=3,
+                            mime="image/png",
+                            type=3,
+                            desc="Cover",
+                            data=thumbnail_data,
+                        )
+                    )
+                    _log("🎨 Attached fallback thumbnail art")
+            else:
+                _log("🎨 No fallback thumbnail art available")
+            id3.save(path, padding=id3_padding)
+
+        if not replaygain:
+            return
+
+        if has_replaygain(path):
+            # mp3gain decodes the whole file; its tags mean the gain is already applied
+            _log("🔊 ReplayGain already applied; skipping mp3gain")
+            return
+
+        _log("🔊 Applying ReplayGain")
+        _flush()
+        sys.stdout.flush()  # keep buffered log lines ahead of mp3gain's output
+        try:
+            subprocess.run(["mp3gain", "-q", "-r", "-k", str(path)], check=True)
+        except FileNotFoundError as exc:
+            _log(
+                f"⚠️ mp3gain not available ({exc}); continuing without ReplayGain normalization"
+            )
+        except subprocess.CalledProcessError as exc:
+            _log(f"⚠️ Error applying ReplayGain: {exc}")
+        except OSError as exc:  # pragma: no cover - unexpected OS-level failure
+            _log(f"⚠️ ReplayGain skipped due to OS error: {exc}")
+    finally:
+        _flush()
 
-    _log("🔊 Applying ReplayGain")
+
+def apply_replaygain(
+    paths: Sequence[str], *, workers: int = 1, log_prefix: str = ""
+) -> List[str]:
+    """Apply track ReplayGain to ``paths`` with as few mp3gain processes as possible.
+
+    Files that already carry ReplayGain data are skipped, and the rest are split
+    into at most ``workers`` concurrent mp3gain runs (more only when a run would
+    exceed ``MP3GAIN_BATCH_SIZE`` files). Returns the paths still lacking
+    ReplayGain afterwards.
+    """
+    pending = [path for path in paths if not has_replaygain(path)]
+    if not pending:
+        return []
+
+    batch_count = max(workers, -(-len(pending) // MP3GAIN_BATCH_SIZE))
+    batch_size = -(-len(pending) // batch_count)
+    batches = [
+        pending[start : start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
+
+    def _run(batch: List[str]) -> None:
+        # Track gain (-r) is computed per file, so batching does not change it
+        subprocess.run(["mp3gain", "-q", "-r", "-k", *batch], check=False)
+
+    print(f"{log_prefix}🔊 Applying ReplayGain to {len(pending)} file(s)")
+    sys.stdout.flush()  # keep buffered log lines ahead of mp3gain's output
     try:
-        subprocess.run(["mp3gain", "-q", "-r", "-k", str(path)], check=True)
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            list(executor.map(_run, batches))
     except FileNotFoundError as exc:
-        _log(
-            f"⚠️ mp3gain not available ({exc}); continuing without ReplayGain normalization"
+        print(
+            f"{log_prefix}⚠️ mp3gain not available ({exc}); continuing without ReplayGain normalization"
         )
-    except subprocess.CalledProcessError as exc:
-        _log(f"⚠️ Error applying ReplayGain: {exc}")
+        return pending
     except OSError as exc:  # pragma: no cover - unexpected OS-level failure
-        _log(f"⚠️ ReplayGain skipped due to OS error: {exc}")
+        print(f"{log_prefix}⚠️ ReplayGain skipped due to OS error: {exc}")
+        return pending
+
+    # mp3gain's exit status covers a whole batch; check each file instead
+    failed = [path for path in pending if not has_replaygain(path)]
+    for path in failed:
+        print(f"{log_prefix}⚠️ ReplayGain not applied to {os.path.basename(path)}")
+    return failed
 
 
 def youtube_to_mp3(query: str, outfile: str, *, use_search: bool = True):
@@ -109,10 +231,17 @@ def youtube_to_mp3(query: str, outfile: str, *, use_search: bool = True):
         "-o",
         outfile,
         "--quiet",
+        "--no-progress",
         "--no-playlist",
     ]
+    sys.stdout.flush()  # keep buffered log lines ahead of yt-dlp's output
     subprocess.run(cmd, check=True)
     print(f"Downloaded: {outfile}")
 
 
-__all__ = ["ensure_easyid3", "tag_mp3", "youtube_to_mp3"]
+__all__ = [
+    "apply_replaygain",
+    "has_replaygain",
+    "tag_mp3",
+    "youtube_to_mp3",
+]
@@ -14,15 +14,16 @@ import textwrap
 import time
 import warnings
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import requests
 from dotenv import load_dotenv
 from requests import Response
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 from openai_utils import openai_speech, openai_text_completion
-from playlist_utils import sanitize_filename_component
 from story_variation import (
     DELIVERY_VARIANTS,
     NARRATIVE_VARIANTS,
@@ -43,6 +44,11 @@ STYLE_HISTORY_PATH = pathlib.Path("stories/style_history.json")
 STYLE_HISTORY_MAX_ENTRIES = 60
 NARRATIVE_AVOID_WINDOW = 3
 DELIVERY_AVOID_WINDOW = 3
+# Snippet file names: path separators and Windows-reserved characters become
+# spaces and apostrophes are dropped, all in one str.translate pass.
+_STORY_NAME_TRANSLATION = str.maketrans(
+    {**{char: " " for char in '/\\:*?"<>|'}, "'": None}
+)
 
 
 @dataclass
@@ -71,7 +77,24 @@ class AzuraCastClient:
         self.base_url = base_url.rstrip("/")
         self.verify_tls = verify_tls
         self.session = requests.Session()
-        self.session.headers.update({"X-API-Key": api_key})
+        self.session.headers.update(
+            {"X-API-Key": api_key, "Accept": "application/json"}
+        )
+        # Now-playing is polled while waiting for the target song; retry
+        # transient gateway errors on reads instead of aborting. Writes are
+        # never retried: a PUT that pushed the story may already have run.
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Last (ETag, payload) per polled path, revalidated with If-None-Match
+        self._etag_cache: Dict[str, Tuple[str, Dict]] = {}
 
         if not verify_tls:
             warnings.filterwarnings("ignore", category=InsecureRequestWarning)
@@ -91,12 +114,25 @@ class AzuraCastClient:
     def get_stations(self) -> List[Dict]:
         return self._request("GET", "/api/stations").json()
 
+    def _get_json_revalidated(self, path: str):
+        """GET a JSON payload, reusing the previous one on 304 Not Modified."""
+        cached = self._etag_cache.get(path)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request("GET", path, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[path] = (etag, payload)
+        return payload
+
     def get_now_playing(self, station: str) -> Dict:
         try:
-            return self._request("GET", f"/api/nowplaying/{station}").json()
+            return self._get_json_revalidated(f"/api/nowplaying/{station}")
         except requests.HTTPError as exc:  # fallback to aggregate endpoint
             if exc.response is not None and exc.response.status_code == 404:
-                payload = self._request("GET", "/api/nowplaying").json()
+                payload = self._get_json_revalidated("/api/nowplaying")
                 for station_payload in payload:
                     shortcode = station_payload.get("station", {}).get("shortcode")
                     if shortcode == station:
@@ -407,8 +443,8 @@ def ensure_story_assets(
     story_text: str,
     delivery_variant: DeliveryVariant,
 ) -> StoryAssets:
-    safe_artist = sanitize_filename_component(artist).replace("'", "")
-    safe_title = sanitize_filename_component(title).replace("'", "")
+    safe_artist = artist.translate(_STORY_NAME_TRANSLATION).strip()
+    safe_title = title.translate(_STORY_NAME_TRANSLATION).strip()
     timestamp = dt.datetime.now()
     date_str = timestamp.strftime("%Y-%m-%d")
     station_dir = STORY_OUTPUT_DIR / station_slug
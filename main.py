@@ -9,26 +9,44 @@ main.py — AI-assisted local-network radio pipeline
 """
 
 import argparse
+import csv
+import io
 import json
+import os
 import pathlib
+import sys
+import threading
 import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from subprocess import CalledProcessError
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import pandas as pd
-from mutagen.easyid3 import EasyID3
-
-from audio_utils import tag_mp3, youtube_to_mp3
-from models import Song, ValidationResult
+from audio_utils import apply_replaygain, tag_mp3, youtube_to_mp3
+from models import Song, SongSnapshot, ValidationResult
 from playlist_utils import (
+    PARTIAL_MP3_SUFFIX,
+    PlaylistEntry,
+    TagCache,
     backfill_songs_from_library,
     deduplicate_and_sort_songs,
     delete_marked_mp3_files,
+    existing_mp3_names,
+    index_songs,
+    is_youtube_url,
     load_playlist,
+    load_tag_cache,
+    mp3_filename,
+    playlist_song_counts,
     playlist_song_key,
+    read_text_tags,
     replace_song_entry,
     sanitize_filename_component,
     save_playlist_with_validation,
+    save_tag_cache,
 )
 from openai_utils import make_fun_fact, openai_speech, openai_text_completion, tts
 from validation_utils import perform_song_validation
@@ -43,8 +61,33 @@ STATION = "neuralcast"
 
 TTS = False  # turn off if you only want music
 VOICE_NAME = "Adam"  # ElevenLabs voice
+DOWNLOAD_WORKERS = 4  # concurrent yt-dlp processes per playlist
+PLAYLIST_LOAD_WORKERS = 8  # concurrent playlist CSV parses
+VALIDATION_WORKERS = 8  # concurrent song/album lookups per playlist
 _METADATA_DIRNAME = "metadata"
 _METADATA_FILENAME = "New Releases.metadata.json"
+LOG_BUFFER_SIZE = 1 << 20  # stdout buffer when output goes to a file or pipe
+
+
+def _buffer_redirected_stdout() -> None:
+    """Give redirected stdout a large buffer; it is flushed once per playlist.
+
+    Interactive terminals keep line buffering so progress stays visible.
+    Subprocesses share the file descriptor, so stdout is also flushed before
+    every yt-dlp/mp3gain call to keep the log in order.
+    """
+    if sys.stdout.isatty():
+        return
+    sys.stdout.flush()
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(
+            io.FileIO(sys.stdout.fileno(), "w", closefd=False),
+            buffer_size=LOG_BUFFER_SIZE,
+        ),
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        write_through=False,
+    )
 
 
 def _resolve_metadata_paths(playlists_dir: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
@@ -63,6 +106,31 @@ def _resolve_metadata_paths(playlists_dir: pathlib.Path) -> tuple[pathlib.Path,
     return preferred_path, preferred_path
 
 
+@lru_cache(maxsize=4096)
+def _normalize_metadata_component(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    # ASCII is already NFKC and casefolds like lower(); other strings only
+    # pay for normalize() when the quick check says they need it.
+    if value.isascii():
+        return value.strip().lower()
+    if not unicodedata.is_normalized("NFKC", value):
+        value = unicodedata.normalize("NFKC", value)
+    return value.strip().casefold()
+
+
+def _normalize_metadata_year(value: Optional[str]) -> str:
+    if value is None:
+        return ""
+    text = str(value).strip()
+    if not text:
+        return ""
+    try:
+        return str(int(text))
+    except ValueError:
+        return text
+
+
 def remove_new_releases_metadata_entries(
     playlists_dir: pathlib.Path, songs_to_remove: List[Song]
 ) -> int:
@@ -95,26 +163,33 @@ def remove_new_releases_metadata_entries(
         )
         return 0
 
-    def normalize_component(value: Optional[str]) -> str:
-        normalized = unicodedata.normalize("NFKC", value or "")
-        return normalized.strip().casefold()
-
-    def normalize_year(value: Optional[str]) -> str:
-        if value is None:
-            return ""
-        text = str(value).strip()
-        if not text:
-            return ""
-        try:
-            return str(int(text))
-        except ValueError:
-            return text
+    # Entry keys are "artist|title|album|year"; index them by (artist, title)
+    # once so each song only scans the keys for its own artist and title.
+    keys_by_song: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+    for existing_key in entries.keys():
+        parts = existing_key.split("|")
+        if len(parts) != 4:
+            continue
+        keys_by_song.setdefault((parts[0], parts[1]), []).append(
+            (parts[2], parts[3], existing_key)
+        )
 
     def matching_keys(song: Song) -> List[str]:
-        artist_component = normalize_component(song.artist)
-        title_component = normalize_component(song.title)
-        album_component = normalize_component(song.album) if song.album else ""
-        year_component = normalize_year(song.year)
+        artist_component = _normalize_metadata_component(song.artist)
+        title_component = _normalize_metadata_component(song.title)
+        same_song_keys = keys_by_song.get((artist_component, title_component), ())
+        if (
+            not same_song_keys
+            and "|" not in artist_component
+            and "|" not in title_component
+        ):
+            # No entry for this artist/title; album and year cannot change that
+            return []
+
+        album_component = (
+            _normalize_metadata_component(song.album) if song.album else ""
+        )
+        year_component = _normalize_metadata_year(song.year)
 
         primary_key = "|".join(
             (artist_component, title_component, album_component, year_component)
@@ -125,17 +200,13 @@ def remove_new_releases_metadata_entries(
         album_filter = album_component or None
         year_filter = year_component or None
         candidates: List[str] = []
-        for existing_key in entries.keys():
-            parts = existing_key.split("|")
-            if len(parts) != 4:
-                continue
-            if parts[0] != artist_component or parts[1] != title_component:
+        for album_part, year_part, existing_key in same_song_keys:
+            if album_filter is not None and album_part != album_component:
                 continue
-            if album_filter is not None and parts[2] != album_component:
+            if year_filter is not None and year_part != year_component:
                 continue
-            if year_filter is not None and parts[3] != year_component:
-                continue
-            candidates.append(existing_key)
+            if existing_key in entries:  # skip entries removed earlier in this run
+                candidates.append(existing_key)
         return candidates
 
     removed = 0
@@ -164,7 +235,7 @@ def remove_new_releases_metadata_entries(
 
         entries.pop(matches[0], None)
         removed += 1
-        song_year = normalize_year(song.year)
+        song_year = _normalize_metadata_year(song.year)
         print(f"🗑️ Removed metadata entry for {song.artist} - {song.title} ({song_year})")
 
     if removed > 0:
@@ -185,7 +256,7 @@ def remove_new_releases_metadata_entries(
             print(f"⚠️ Unexpected error while writing metadata file {write_path}: {exc}")
 
     for song in missing:
-        song_year = normalize_year(song.year)
+        song_year = _normalize_metadata_year(song.year)
         print(
             f"⚠️ New Releases metadata entry not found for {song.artist} - {song.title} ({song_year}); nothing removed"
         )
@@ -197,7 +268,220 @@ def remove_new_releases_metadata_entries(
     return removed
 
 
-def main(station_name: str, dry_run: bool = False):  # dry_run flag
+@contextmanager
+def _atomic_replace(target: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Yield a staging path that replaces ``target`` only if the block succeeds.
+
+    The staging file sits next to ``target`` (same filesystem) so the swap is a
+    single ``os.replace``; on failure it is removed and ``target`` is untouched.
+    """
+    staging_path = target.with_name(
+        f".{target.stem}.{os.getpid()}{PARTIAL_MP3_SUFFIX}"
+    )
+    try:
+        yield staging_path
+        os.replace(staging_path, target)
+    except BaseException:
+        try:
+            staging_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _mp3_path(music_dir: pathlib.Path, song: Song) -> pathlib.Path:
+    """Return where ``song`` lives in a playlist's music directory."""
+    return music_dir / mp3_filename(song.artist, song.title)
+
+
+def _recache_tags(tag_cache: TagCache, song_path: pathlib.Path) -> None:
+    """Refresh a file's cache entry after tag_mp3 rewrote it."""
+    try:
+        file_stat = song_path.stat()
+        tags = read_text_tags(song_path)
+    except Exception:  # noqa: BLE001 - the stale entry just misses next run
+        return
+    tag_cache.set(song_path.name, file_stat.st_mtime_ns, file_stat.st_size, tags)
+
+
+def _validate_songs(
+    song_entries: List[Tuple[Song, pathlib.Path]],
+    playlist_name: str,
+    invalid_albums: List[dict],
+) -> List[ValidationResult]:
+    """Validate songs concurrently, returning results in input order.
+
+    Each lookup collects its invalid-album rows separately; they are appended
+    in input order afterwards so the report does not depend on thread timing.
+    """
+
+    def _validate(song_entry: Tuple[Song, pathlib.Path]):
+        album_rows: List[dict] = []
+        result = perform_song_validation(song_entry[0], playlist_name, album_rows)
+        return result, album_rows
+
+    with ThreadPoolExecutor(
+        max_workers=min(VALIDATION_WORKERS, len(song_entries))
+    ) as executor:
+        outcomes = list(executor.map(_validate, song_entries))
+
+    results: List[ValidationResult] = []
+    for result, album_rows in outcomes:
+        invalid_albums.extend(album_rows)
+        results.append(result)
+    return results
+
+
+INVALID_ALBUM_COLUMNS = ["Artist", "Title", "Album", "Playlist", "Reason"]
+# Above this many rows the vectorized pandas dedup pays for building a DataFrame
+INVALID_ALBUMS_PANDAS_THRESHOLD = 10_000
+
+
+def _write_invalid_albums(path: pathlib.Path, rows: List[dict]) -> int:
+    """Write deduplicated albums_not_validated rows and return how many were kept.
+
+    Rows are deduplicated on case/whitespace-normalized values, keeping the
+    first original row.
+    """
+    text_columns = INVALID_ALBUM_COLUMNS[:-1]
+    if len(rows) > INVALID_ALBUMS_PANDAS_THRESHOLD:
+        import pandas as pd
+
+        # Rows are flat string dicts, so build straight from the records; this
+        # branch only runs above the threshold, so the frame is never empty
+        df = pd.DataFrame.from_records(rows, columns=INVALID_ALBUM_COLUMNS)
+        key_columns = []
+        for column in text_columns:
+            key_column = f"_{column.lower()}_key"
+            df[key_column] = df[column].astype(str).str.lower().str.strip()
+            key_columns.append(key_column)
+        df = df.drop_duplicates(
+            subset=key_columns + ["Reason"], keep="first", ignore_index=True
+        ).drop(columns=key_columns)
+        try:  # Optional dependency; Arrow's CSV writer is much faster on big frames
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:  # pragma: no cover - pyarrow is optional
+            df.to_csv(path, index=False)
+        else:
+            pa_csv.write_csv(
+                pa.Table.from_pandas(df, preserve_index=False),
+                str(path),
+                write_options=pa_csv.WriteOptions(quoting_style="needed"),
+            )
+        return len(df)
+
+    deduped = []
+    seen = set()
+    for row in rows:
+        key = tuple(str(row[column]).lower().strip() for column in text_columns) + (
+            row["Reason"],
+        )
+        if key not in seen:
+            seen.add(key)
+            deduped.append(row)
+
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(
+            handle, fieldnames=INVALID_ALBUM_COLUMNS, lineterminator="\n"
+        )
+        writer.writeheader()
+        writer.writerows(deduped)
+    return len(deduped)
+
+
+def _write_repetition_analysis(
+    all_songs_by_playlist: Dict[str, List[SongSnapshot]],
+    analysis_log_file: pathlib.Path,
+) -> None:
+    """Write the cross-playlist repetition report straight to its log file."""
+    with open(
+        analysis_log_file, "w", encoding="utf-8", buffering=LOG_BUFFER_SIZE
+    ) as analysis_file:
+
+        def log(line: str = ""):
+            analysis_file.write(f"{line}\n")
+
+        log("\n" + "=" * 60)
+        log("📊 CROSS-PLAYLIST REPETITION ANALYSIS")
+        log("=" * 60)
+
+        # Create a dictionary to track songs and which playlists they appear in
+        # Kept as two parallel maps: the first snapshot per key (write-once) and
+        # the playlists it appears in, instead of a small dict per song
+        song_by_key: Dict[Tuple[str, str], SongSnapshot] = {}
+        playlists_by_key: Dict[Tuple[str, str], List[str]] = {}
+        # Keys are recorded the moment they reach a second playlist, so finding
+        # the duplicates does not need another pass over every unique song
+        duplicate_keys: List[Tuple[str, str]] = []
+        total_songs = 0
+
+        for playlist_name, playlist_songs in all_songs_by_playlist.items():
+            total_songs += len(playlist_songs)
+            for song in playlist_songs:
+                # Case/whitespace-insensitive key, normalized once per snapshot
+                song_key = song.key
+                playlists = playlists_by_key.get(song_key)
+                if playlists is None:
+                    song_by_key[song_key] = song
+                    playlists_by_key[song_key] = [playlist_name]
+                else:
+                    playlists.append(playlist_name)
+                    if len(playlists) == 2:
+                        duplicate_keys.append(song_key)
+
+        # Tally how many playlists each duplicate appears in. Each duplicate is
+        # recorded as (playlist_count, key, playlists) so the report can sort on
+        # the count computed here
+        duplicates: List[Tuple[int, Tuple[str, str], List[str]]] = []
+        appearance_counts = Counter()
+        for song_key in duplicate_keys:
+            playlists = playlists_by_key[song_key]
+            playlist_count = len(playlists)
+            duplicates.append((playlist_count, song_key, playlists))
+            appearance_counts[playlist_count] += 1
+
+        total_unique_songs = len(playlists_by_key)
+        duplicate_songs = len(duplicates)
+        unique_songs = total_unique_songs - duplicate_songs
+
+        log(f"\n📈 Summary:")
+        log(f"   Total songs across all playlists: {total_songs}")
+        log(f"   Total unique songs across all playlists: {total_unique_songs}")
+        log(f"   Songs appearing in multiple playlists: {duplicate_songs}")
+        log(f"   Songs appearing in only one playlist: {unique_songs}")
+
+        if duplicate_songs > 0:
+            duplication_percentage = (duplicate_songs / total_unique_songs) * 100
+            log(f"   Duplication rate: {duplication_percentage:.1f}%")
+
+            log(f"\n🔄 Songs appearing in multiple playlists:")
+
+            # Sort duplicates by number of appearances (descending)
+            duplicates.sort(key=itemgetter(0), reverse=True)
+
+            for playlist_count, song_key, playlists in duplicates:
+                song = song_by_key[song_key]
+
+                log(f"\n   🎵 {song.artist} - {song.title} ({song.year})")
+                log(f"      Appears in {playlist_count} playlists: {', '.join(playlists)}")
+
+            # Show statistics by number of appearances
+            log(f"\n📊 Breakdown by number of appearances:")
+            for count, songs_count in sorted(appearance_counts.items(), reverse=True):
+                log(f"   {songs_count} song(s) appear in {count} playlists")
+        else:
+            log(f"\n✅ No duplicate songs found across playlists!")
+
+        log("\n" + "=" * 60)
+
+
+def main(
+    station_name: str,
+    dry_run: bool = False,  # dry_run flag
+    download_workers: int = DOWNLOAD_WORKERS,
+    preparsed_playlists: Optional[dict] = None,
+):
     global PLAYLISTS_PATH, STATION_PATH, STATION
     # Determine the base path for stations (the project dir where this script lives)
     script_dir = pathlib.Path(__file__).parent
@@ -231,39 +515,55 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
         return
 
     # First pass: load playlists and collect deletion markers
-    playlist_entries = []
-    for playlist_file in playlist_files:
-        # CHANGED: load_playlist now returns (songs, playlist_needs_save, deletions, df)
-        songs, playlist_needs_save, deletions, playlist_df = load_playlist(
-            playlist_file
+    playlist_entries: List[PlaylistEntry] = []
+    # Playlist files are read in parallel so their disk reads overlap
+    with ThreadPoolExecutor(
+        max_workers=min(PLAYLIST_LOAD_WORKERS, len(playlist_files))
+    ) as executor:
+        loaded_playlists = list(
+            executor.map(
+                lambda playlist_file: load_playlist(playlist_file, preparsed_playlists),
+                playlist_files,
+            )
         )
+    if preparsed_playlists:
+        # Parses for playlists that changed since listing are not needed
+        preparsed_playlists.clear()
+    for playlist_file, loaded in zip(playlist_files, loaded_playlists):
+        # CHANGED: load_playlist now returns (songs, playlist_needs_save, deletions, table)
+        songs, playlist_needs_save, deletions, playlist_table = loaded
         playlist_entries.append(
-            {
-                "file": playlist_file,
-                "name": playlist_file.stem,
-                "songs": songs,
-                "needs_save": playlist_needs_save,
-                "deletions": deletions,
-                "df": playlist_df,  # keep the full DataFrame for extra columns
-            }
+            PlaylistEntry(
+                file=playlist_file,
+                name=playlist_file.stem,
+                songs=songs,
+                needs_save=playlist_needs_save,
+                deletions=deletions,
+                table=playlist_table,  # keep the raw CSV rows for extra columns
+            )
         )
 
     deletion_targets: Dict[Tuple[str, str], Song] = {}
-    deletion_sources: Dict[Tuple[str, str], set] = {}
-    for entry in playlist_entries:
-        for song in entry["deletions"]:
+    deletion_sources: Dict[Tuple[str, str], List[str]] = {}
+    # Visiting playlists by name keeps every source list sorted as it is
+    # built (glob order is arbitrary anyway); repeats within one playlist
+    # are adjacent, so comparing with the last name is enough to dedupe.
+    for entry in sorted(playlist_entries, key=attrgetter("name")):
+        for song in entry.deletions:
             if not song.artist or not song.title:
                 continue
             key = playlist_song_key(song)
-            if key not in deletion_targets:
+            sources = deletion_sources.get(key)
+            if sources is None:
                 deletion_targets[key] = song
-            deletion_sources.setdefault(key, set()).add(entry["name"])
+                deletion_sources[key] = [entry.name]
+            elif sources[-1] != entry.name:
+                sources.append(entry.name)
 
     if deletion_targets:
         print(f"\n🛑 Songs marked for deletion via [DEL]: {len(deletion_targets)}")
         for key, song in deletion_targets.items():
-            playlists_list = sorted(deletion_sources.get(key, []))
-            playlists_note = ", ".join(playlists_list)
+            playlists_note = ", ".join(deletion_sources[key])
             print(f"   • {song.artist} - {song.title} (marked in: {playlists_note})")
 
         deleted_files = delete_marked_mp3_files(deletion_targets, STATION_PATH)
@@ -271,7 +571,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             print(f"🗑️ Deleted {deleted_files} MP3 file(s) due to [DEL] markers")
 
         for entry in playlist_entries:
-            songs = entry["songs"]
+            songs = entry.songs
             filtered_songs = [
                 song
                 for song in songs
@@ -279,29 +579,30 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             ]
             removed_count = len(songs) - len(filtered_songs)
             if removed_count > 0:
-                entry["songs"] = filtered_songs
-                entry["needs_save"] = True
-                entry["removed_via_marker"] = removed_count
+                entry.songs = filtered_songs
+                entry.needs_save = True
+                entry.removed_via_marker = removed_count
 
-            if entry["deletions"] and entry["name"].casefold() == "new releases":
+            if entry.deletions and entry.name.casefold() == "new releases":
                 removed_metadata = remove_new_releases_metadata_entries(
-                    entry["file"].parent, entry["deletions"]
+                    entry.file.parent, entry.deletions
                 )
                 if removed_metadata:
-                    entry["metadata_removed"] = removed_metadata
+                    entry.metadata_removed = removed_metadata
 
     # Store all songs across playlists for repetition analysis
     all_songs_by_playlist = {}
+    song_snapshots: Dict[Tuple[str, str, str], SongSnapshot] = {}
 
     for entry in playlist_entries:
-        playlist_file = entry["file"]
-        playlist_name = entry["name"]
+        playlist_file = entry.file
+        playlist_name = entry.name
         print(f"\n--------------------------------------------")
         print(f"Processing playlist: {playlist_name}")
 
-        songs = entry["songs"]
-        playlist_needs_save = entry["needs_save"]
-        removed_via_marker = entry.get("removed_via_marker", 0)
+        songs = entry.songs
+        playlist_needs_save = entry.needs_save
+        removed_via_marker = entry.removed_via_marker
 
         if removed_via_marker:
             print(
@@ -322,53 +623,57 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
         if duplicates_removed > 0:
             print(f"Removed {duplicates_removed} duplicate(s) from {playlist_file}")
 
-        # When updating playlist, update the DataFrame, not just the list of songs
+        # When updating playlist, update the table, not just the list of songs
         # For example, after deduplication, validation, or removal:
-        # - Update the DataFrame rows for standard columns (artist, title, etc.)
+        # - Update the table rows for standard columns (artist, title, etc.)
         # - Keep all other columns unchanged
 
         # When saving:
-        # save_playlist_with_validation should now take the DataFrame and write all columns
+        # save_playlist_with_validation takes the table and writes all columns
         if playlist_needs_save or library_changed or normalized_changed:
-            save_playlist_with_validation(playlist_file, songs, entry["df"])
+            save_playlist_with_validation(playlist_file, songs, entry.table)
 
         if not songs:
             print(f"No valid songs found in {playlist_file}")
-            entry["songs"] = songs
+            entry.songs = songs
             all_songs_by_playlist[playlist_name] = []
             continue
 
-        entry["songs"] = songs
+        entry.songs = songs
+        # Positions stay stable until invalid songs are filtered out after validation
+        song_index = index_songs(songs)
 
         print(f"Found {len(songs)} songs in playlist:")
         print("")
 
-        # Separate songs into validated and unvalidated
-        validated_songs = [song for song in songs if song.validated]
-        unvalidated_songs = [song for song in songs if not song.validated]
-
-        print(f"📊 Validation Statistics:")
-        print(f"   Previously validated songs: {len(validated_songs)}")
-        print(f"   Songs needing validation: {len(unvalidated_songs)}")
-
-        # Handle forced YouTube overrides before standard download detection
+        # One pass over the playlist counts validated songs, builds each
+        # song's library path (shared by the override pass and the
+        # existing/missing classification below) and collects forced overrides
+        validated_count = 0
+        song_paths: Dict[int, pathlib.Path] = {}
         override_candidates = []
         for song in songs:
-            if not song.override_url:
-                continue
+            if song.validated:
+                validated_count += 1
+            song_path = _mp3_path(music_dir, song)
+            song_paths[id(song)] = song_path
+            if song.override_url:
+                has_names = sanitize_filename_component(
+                    song.artist or ""
+                ) and sanitize_filename_component(song.title or "")
+                override_candidates.append((song, song_path if has_names else None))
 
-            safe_artist = (
-                sanitize_filename_component(song.artist) if song.artist else ""
-            )
-            safe_title = sanitize_filename_component(song.title) if song.title else ""
-            override_path = (
-                music_dir / f"{safe_artist} - {safe_title}.mp3"
-                if safe_artist and safe_title
-                else None
-            )
-            override_candidates.append((song, override_path))
+        print(f"📊 Validation Statistics:")
+        print(f"   Previously validated songs: {validated_count}")
+        print(f"   Songs needing validation: {len(songs) - validated_count}")
+
+        # One directory scan instead of a stat() per song; refreshed below if
+        # forced overrides changed the directory
+        present_files = existing_mp3_names(music_dir)
 
+        # Handle forced YouTube overrides before standard download detection
         override_updates = False
+        overrides_attempted = False
 
         for song, song_path in override_candidates:
             url = song.override_url
@@ -377,9 +682,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 print(f"⚠️ Override skipped; missing artist/title for URL {url}")
                 continue
 
-            if not url or not any(
-                host in url.lower() for host in ("youtube.com", "youtu.be")
-            ):
+            if not is_youtube_url(url):
                 print(f"⚠️ Override skipped; unsupported URL {url}")
                 continue
 
@@ -397,31 +700,23 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 )
                 continue
 
-            file_existed = song_path.exists()
-            backup_path = None
-            backup_created = False
+            file_existed = present_files.contains_file(song_path.name)
+            overrides_attempted = True
 
             try:
-                if file_existed:
-                    backup_path = song_path.with_suffix(song_path.suffix + ".bak")
-                    if backup_path.exists():
-                        backup_path.unlink()
-                    song_path.rename(backup_path)
-                    backup_created = True
-
-                youtube_to_mp3(url, str(song_path), use_search=False)
-                tag_mp3(
-                    str(song_path),
-                    song.artist,
-                    song.title,
-                    song.year,
-                    playlist_name,
-                    song.album,
-                    log_prefix="      ",
-                )
-
-                if backup_path and backup_path.exists():
-                    backup_path.unlink()
+                # The original file stays in place until the replacement has
+                # been downloaded and tagged, then is swapped out atomically.
+                with _atomic_replace(song_path) as staging_path:
+                    youtube_to_mp3(url, str(staging_path), use_search=False)
+                    tag_mp3(
+                        str(staging_path),
+                        song.artist,
+                        song.title,
+                        song.year,
+                        playlist_name,
+                        song.album,
+                        log_prefix="      ",
+                    )
 
                 song.override_url = None
                 override_updates = True
@@ -433,68 +728,32 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 )
                 print(f"   {replacement_note}")
 
-            except CalledProcessError as exc:
-                print("   Override failed; original retained")
-                print(f"     Reason: {exc}")
-
-                if song_path.exists() and backup_created:
-                    try:
-                        song_path.unlink()
-                    except Exception:
-                        pass
-
-                if backup_created and backup_path and backup_path.exists():
-                    try:
-                        backup_path.rename(song_path)
-                    except Exception as restore_exc:
-                        print(
-                            f"     Warning: failed to restore original file from backup: {restore_exc}"
-                        )
-
             except Exception as exc:
                 print("   Override failed; original retained")
                 print(f"     Reason: {exc}")
 
-                if song_path.exists() and backup_created:
-                    try:
-                        song_path.unlink()
-                    except Exception:
-                        pass
-
-                if backup_created and backup_path and backup_path.exists():
-                    try:
-                        backup_path.rename(song_path)
-                    except Exception as restore_exc:
-                        print(
-                            f"     Warning: failed to restore original file from backup: {restore_exc}"
-                        )
-
         if override_updates:
-            save_playlist_with_validation(playlist_file, songs, entry["df"])
+            save_playlist_with_validation(playlist_file, songs, entry.table)
 
         # Check which songs already exist and which need to be downloaded
         existing_songs = []
         missing_songs = []
 
         pending_overrides = 0
+        if overrides_attempted:
+            present_files = existing_mp3_names(music_dir)
 
         for song in songs:
-            artist = song.artist
-            title = song.title
-            year = song.year
-
-            # Create safe filename
-            safe_artist = sanitize_filename_component(artist)
-            safe_title = sanitize_filename_component(title)
-            song_path = music_dir / f"{safe_artist} - {safe_title}.mp3"
+            song_path = song_paths[id(song)]
+            file_name = song_path.name
 
             if song.override_url:
                 pending_overrides += 1
-                if song_path.exists():
+                if present_files.contains_file(file_name):
                     existing_songs.append((song, song_path))
                 continue
 
-            if song_path.exists():
+            if present_files.contains_file(file_name):
                 existing_songs.append((song, song_path))
             else:
                 missing_songs.append((song, song_path))
@@ -516,6 +775,9 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             print("\n🖊️ DRY-RUN: Auditing existing MP3 tags and album art...")
             refreshed = 0
             untouched = 0
+            # Backfill has just cached the tags of every file it scanned;
+            # unchanged files are audited from the cache instead of re-read.
+            tag_cache = load_tag_cache(music_dir)
             for song, song_path in existing_songs:
                 track_label = (
                     f"{song.artist or 'Unknown Artist'} - "
@@ -523,20 +785,17 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 )
                 status_lines: List[str] = []
                 try:
-                    audio = EasyID3(str(song_path))
-                    cur_artist = (
-                        audio.get("artist", [""])[0] if audio.get("artist") else ""
-                    )
-                    cur_title = (
-                        audio.get("title", [""])[0] if audio.get("title") else ""
-                    )
-                    cur_year = audio.get("date", [""])[0] if audio.get("date") else ""
-                    cur_genre = (
-                        audio.get("genre", [""])[0] if audio.get("genre") else ""
-                    )
-                    cur_album = (
-                        audio.get("album", [""])[0] if audio.get("album") else ""
-                    )
+                    file_stat = song_path.stat()
+                    mtime_ns, size = file_stat.st_mtime_ns, file_stat.st_size
+                    tags = tag_cache.get(song_path.name, mtime_ns, size)
+                    if tags is None:
+                        tags = read_text_tags(song_path)
+                        tag_cache.set(song_path.name, mtime_ns, size, tags)
+                    cur_artist = tags.get("artist", "")
+                    cur_title = tags.get("title", "")
+                    cur_year = tags.get("date", "")
+                    cur_genre = tags.get("genre", "")
+                    cur_album = tags.get("album", "")
                 except Exception as e:
                     status_lines.append(
                         f"⚠️ Cannot read tags ({e}); rewriting metadata + album art"
@@ -550,6 +809,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                         song.album,
                         log_prefix="      ",
                     )
+                    _recache_tags(tag_cache, song_path)
                     refreshed += 1
                     print(f"   • {track_label} ({song_path.name})")
                     for line in status_lines:
@@ -586,6 +846,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                         song.album,
                         log_prefix="      ",
                     )
+                    _recache_tags(tag_cache, song_path)
                     refreshed += 1
                 else:
                     status_lines.append("✅ Tags already match; no changes needed")
@@ -595,6 +856,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 for line in status_lines:
                     print(f"      {line}")
 
+            save_tag_cache(music_dir, tag_cache)
             print(
                 f"   Summary: refreshed {refreshed} file(s), {untouched} already up to date."
             )
@@ -616,10 +878,12 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 valid_existing: List[Tuple[Song, pathlib.Path]] = []
                 invalid_existing: List[Tuple[Song, pathlib.Path]] = []
 
-                for song, song_path in unvalidated_existing:
-                    result = perform_song_validation(
-                        song, playlist_name, invalid_albums
-                    )
+                validation_results = _validate_songs(
+                    unvalidated_existing, playlist_name, invalid_albums
+                )
+                for (song, song_path), result in zip(
+                    unvalidated_existing, validation_results
+                ):
 
                     if result.album_validated is True and result.album:
                         print(f"   ↳ Album validated: {result.album}")
@@ -632,7 +896,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                             print(f"   ↳ Album not validated: {result.album}")
 
                     if result.status == "valid" and result.song:
-                        replace_song_entry(songs, result.song)
+                        replace_song_entry(songs, result.song, song_index)
                         valid_existing.append((result.song, song_path))
                         validation_updates = True
                         print(
@@ -670,12 +934,13 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
         # Validate missing songs (ensure BOTH previously validated and newly validated get downloaded)
         # BUGFIX: Previously, if any unvalidated songs existed, already validated-but-missing songs
         # were skipped from downloads. We now always include them.
-        pre_validated_missing = [
-            (song, path) for song, path in missing_songs if song.validated
-        ]
-        unvalidated_missing = [
-            (song, path) for song, path in missing_songs if not song.validated
-        ]
+        pre_validated_missing: List[Tuple[Song, pathlib.Path]] = []
+        unvalidated_missing: List[Tuple[Song, pathlib.Path]] = []
+        for song_entry in missing_songs:
+            if song_entry[0].validated:
+                pre_validated_missing.append(song_entry)
+            else:
+                unvalidated_missing.append(song_entry)
 
         if unvalidated_missing:
             scope = "[DRY-RUN] " if dry_run else ""
@@ -686,8 +951,10 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             newly_validated: List[Tuple[Song, pathlib.Path]] = []
             invalid_songs: List[Tuple[Song, pathlib.Path]] = []
 
-            for song, song_path in unvalidated_missing:
-                result = perform_song_validation(song, playlist_name, invalid_albums)
+            validation_results = _validate_songs(
+                unvalidated_missing, playlist_name, invalid_albums
+            )
+            for (song, song_path), result in zip(unvalidated_missing, validation_results):
 
                 if result.album_validated is True and result.album:
                     print(f"   ↳ Album validated: {result.album}")
@@ -698,7 +965,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                         print(f"   ↳ Album not validated: {result.album}")
 
                 if result.status == "valid" and result.song:
-                    replace_song_entry(songs, result.song)
+                    replace_song_entry(songs, result.song, song_index)
                     newly_validated.append((result.song, song_path))
                     validation_updates = True
                     print(
@@ -739,8 +1006,13 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             # Remove invalid songs
             if songs_to_remove_from_playlist:
                 original_song_count = len(songs)
+                # Song models are unhashable; playlists are deduplicated by this
+                # key, so a key set gives the same result as list membership.
+                remove_keys = {
+                    playlist_song_key(song) for song in songs_to_remove_from_playlist
+                }
                 songs = [
-                    song for song in songs if song not in songs_to_remove_from_playlist
+                    song for song in songs if playlist_song_key(song) not in remove_keys
                 ]
                 removed_count = original_song_count - len(songs)
                 print(
@@ -748,7 +1020,7 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
                 )
 
             # Save updated playlist with validation status and all columns
-            save_playlist_with_validation(str(playlist_file), songs, entry["df"])
+            save_playlist_with_validation(str(playlist_file), songs, entry.table)
             print(f"📝 Updated validation status in playlist CSV file")
 
         if valid_count == 0 and missing_count > 0:
@@ -774,169 +1046,120 @@ def main(station_name: str, dry_run: bool = False):  # dry_run flag
             downloaded_count = 0
             failed_count = 0
 
-            for idx, (song, song_path) in enumerate(valid_songs, start=1):
-                artist = song.artist
-                title = song.title
-                year = song.year
-                try:
+            # Each song is downloaded and tagged in its own worker; results are
+            # reported as they complete.
+            print_lock = threading.Lock()
+
+            def _download_and_tag(
+                idx: int, song: Song, song_path: pathlib.Path
+            ) -> Tuple[Song, str, Optional[CalledProcessError]]:
+                artist, title = song.artist, song.title
+                target = str(song_path)
+                with print_lock:
                     print(f"⬇ [{idx}/{valid_count}] Downloading: {artist} - {title}")
-                    youtube_to_mp3(f"{artist} {title}", str(song_path))
+                try:
+                    youtube_to_mp3(f"{artist} {title}", target)
                     tag_mp3(
-                        str(song_path),
+                        target,
                         artist,
                         title,
-                        year,
+                        song.year,
                         playlist_name,
                         song.album,
                         log_prefix="      ",
+                        replaygain=False,
                     )
-                    print(f"✓ Downloaded and tagged: {artist} - {title}")
-                    downloaded_count += 1
                 except CalledProcessError as e:
-                    print(f"✗ Failed to download {artist} - {title}: {e}")
-                    failed_count += 1
-                    continue
+                    return song, target, e
+                return song, target, None
+
+            # ReplayGain runs once over all new files after the downloads,
+            # instead of spawning mp3gain for every song.
+            tagged_paths: List[str] = []
+
+            if valid_songs:
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(download_workers, valid_count))
+                ) as executor:
+                    download_futures = [
+                        executor.submit(_download_and_tag, idx, song, song_path)
+                        for idx, (song, song_path) in enumerate(valid_songs, start=1)
+                    ]
+                    for future in as_completed(download_futures):
+                        song, target, error = future.result()
+                        with print_lock:
+                            if error is None:
+                                print(
+                                    f"✓ Downloaded and tagged: {song.artist} - {song.title}"
+                                )
+                                downloaded_count += 1
+                                tagged_paths.append(target)
+                            else:
+                                print(
+                                    f"✗ Failed to download {song.artist} - {song.title}: {error}"
+                                )
+                                failed_count += 1
+
+            if tagged_paths:
+                apply_replaygain(
+                    tagged_paths, workers=download_workers, log_prefix="   "
+                )
 
         # Final summary
         total_removed = len(songs_to_remove_from_playlist)
         final_song_count = len(songs)
 
-        print(f"\n📋 Final Summary for '{playlist_name}':")
-        print(f"   Original songs in playlist: {total_songs}")
-        print(f"   Songs removed (invalid): {total_removed}")
-        print(f"   Final songs in playlist: {final_song_count}")
-        print(f"   Successfully downloaded: {downloaded_count}")
-        print(f"   Failed downloads: {failed_count}")
-
+        # Emit the summary block with a single write
+        summary_lines = [
+            f"\n📋 Final Summary for '{playlist_name}':",
+            f"   Original songs in playlist: {total_songs}",
+            f"   Songs removed (invalid): {total_removed}",
+            f"   Final songs in playlist: {final_song_count}",
+            f"   Successfully downloaded: {downloaded_count}",
+            f"   Failed downloads: {failed_count}",
+        ]
         if failed_count > 0:
-            print(f"   ⚠️ {failed_count} song(s) failed to download")
+            summary_lines.append(f"   ⚠️ {failed_count} song(s) failed to download")
         if total_removed > 0:
-            print(
+            summary_lines.append(
                 f"   🗑️ {total_removed} invalid song(s) removed from playlist and files deleted"
             )
+        sys.stdout.write("\n".join(summary_lines) + "\n")
 
-        all_songs_by_playlist[playlist_name] = [
-            Song(
-                artist=song.artist,
-                title=song.title,
-                year=song.year,
-                album=song.album,
-                validated=song.validated,
-            )
-            for song in songs
-        ]
+        # The analysis only needs artist/title/year; slotted snapshots keep
+        # every playlist's songs alive without a pydantic model per entry.
+        # A song listed in several playlists shares one snapshot instance.
+        playlist_snapshots = []
+        for song in songs:
+            snapshot_key = (song.artist, song.title, song.year)
+            snapshot = song_snapshots.get(snapshot_key)
+            if snapshot is None:
+                snapshot = song_snapshots[snapshot_key] = SongSnapshot.from_song(song)
+            playlist_snapshots.append(snapshot)
+        all_songs_by_playlist[playlist_name] = playlist_snapshots
 
         print(f"Finished processing playlist: {playlist_name}")
+        sys.stdout.flush()
 
     # Analyze cross-playlist repetition
-    # REPLACED prints with log-to-file
-    analysis_lines: List[str] = []
-
-    def log(line: str = ""):
-        analysis_lines.append(line)
-
-    log("\n" + "=" * 60)
-    log("📊 CROSS-PLAYLIST REPETITION ANALYSIS")
-    log("=" * 60)
-
-    # Create a dictionary to track songs and which playlists they appear in
-    song_appearances = {}
-
-    for playlist_name, playlist_songs in all_songs_by_playlist.items():
-        for song in playlist_songs:
-            # Use a more robust key that handles case and whitespace
-            song_key = (song.artist.lower().strip(), song.title.lower().strip())
-            if song_key not in song_appearances:
-                song_appearances[song_key] = {"song": song, "playlists": []}
-            song_appearances[song_key]["playlists"].append(playlist_name)
-
-    # Find duplicates (songs appearing in more than one playlist)
-    duplicates = {k: v for k, v in song_appearances.items() if len(v["playlists"]) > 1}
-
-    total_songs = sum(
-        len(playlist_songs) for playlist_songs in all_songs_by_playlist.values()
-    )
-    total_unique_songs = len(song_appearances)
-    duplicate_songs = len(duplicates)
-    unique_songs = total_unique_songs - duplicate_songs
-
-    log(f"\n📈 Summary:")
-    log(f"   Total songs across all playlists: {total_songs}")
-    log(f"   Total unique songs across all playlists: {total_unique_songs}")
-    log(f"   Songs appearing in multiple playlists: {duplicate_songs}")
-    log(f"   Songs appearing in only one playlist: {unique_songs}")
-
-    if duplicate_songs > 0:
-        duplication_percentage = (duplicate_songs / total_unique_songs) * 100
-        log(f"   Duplication rate: {duplication_percentage:.1f}%")
-
-        log(f"\n🔄 Songs appearing in multiple playlists:")
-
-        # Sort duplicates by number of appearances (descending)
-        sorted_duplicates = sorted(
-            duplicates.items(), key=lambda x: len(x[1]["playlists"]), reverse=True
-        )
-
-        for song_key, info in sorted_duplicates:
-            song = info["song"]
-            playlists = info["playlists"]
-            playlist_count = len(playlists)
-
-            log(f"\n   🎵 {song.artist} - {song.title} ({song.year})")
-            log(f"      Appears in {playlist_count} playlists: {', '.join(playlists)}")
-
-        # Show statistics by number of appearances
-        appearance_counts = {}
-        for info in duplicates.values():
-            count = len(info["playlists"])
-            appearance_counts[count] = appearance_counts.get(count, 0) + 1
-
-        log(f"\n📊 Breakdown by number of appearances:")
-        for count in sorted(appearance_counts.keys(), reverse=True):
-            songs_count = appearance_counts[count]
-            log(f"   {songs_count} song(s) appear in {count} playlists")
-    else:
-        log(f"\n✅ No duplicate songs found across playlists!")
-
-    log("\n" + "=" * 60)
-
-    # Write analysis to a station-scoped log file
+    # REPLACED prints with log-to-file (station-scoped)
     analysis_log_file = STATION_PATH.parent / "duplicate_analysis.log"
-    with open(analysis_log_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(analysis_lines) + "\n")
+    _write_repetition_analysis(all_songs_by_playlist, analysis_log_file)
     print(f"📝 Cross-playlist analysis written to {analysis_log_file}")
 
     # write albums that were not validated to CSV in the station directory
     invalid_albums_path = STATION_PATH.parent / "albums_not_validated.csv"
-    # Deduplicate entries
-    if invalid_albums:
-        deduped = []
-        seen = set()
-        for row in invalid_albums:
-            key = (
-                row["Artist"].lower().strip(),
-                row["Title"].lower().strip(),
-                row["Album"].lower().strip(),
-                row["Playlist"].lower().strip(),
-                row["Reason"],
-            )
-            if key not in seen:
-                seen.add(key)
-                deduped.append(row)
-        invalid_albums = deduped
-
-    df = pd.DataFrame(
-        invalid_albums or [],
-        columns=["Artist", "Title", "Album", "Playlist", "Reason"],
-    )
-    df.to_csv(invalid_albums_path, index=False)
+    written = _write_invalid_albums(invalid_albums_path, invalid_albums)
     print(
-        f"📝 Albums not validated written to {invalid_albums_path} ({len(df)} row(s))"
+        f"📝 Albums not validated written to {invalid_albums_path} ({written} row(s))"
     )
 
 
-def list_playlists(station_name: str):
-    """List all available playlists."""
+def list_playlists(station_name: str) -> dict:
+    """List all available playlists.
+
+    Returns the playlists parsed while counting songs, for ``main`` to reuse.
+    """
     global PLAYLISTS_PATH, STATION_PATH
     # Determine the base path for stations (the project dir where this script lives)
     script_dir = pathlib.Path(__file__).parent
@@ -949,18 +1172,20 @@ def list_playlists(station_name: str):
     playlists_dir = pathlib.Path(PLAYLISTS_PATH)
     if not playlists_dir.exists():
         print(f"Playlists directory '{PLAYLISTS_PATH}' does not exist!")
-        return
+        return {}
 
     playlist_files = list(playlists_dir.glob("*.csv"))
     if not playlist_files:
         print(f"No playlist files found in '{PLAYLISTS_PATH}' directory!")
-        return
+        return {}
 
     print("Available playlists:")
+    song_counts, parsed_playlists = playlist_song_counts(playlist_files)
     for idx, playlist_file in enumerate(playlist_files):
         playlist_name = playlist_file.stem
-        songs, _, _, _ = load_playlist(playlist_file)
-        print(f"{idx}: {playlist_name} ({len(songs)} songs)")
+        print(f"{idx}: {playlist_name} ({song_counts[playlist_file]['songs']} songs)")
+
+    return parsed_playlists
 
 
 if __name__ == "__main__":
@@ -980,10 +1205,22 @@ if __name__ == "__main__":
         action="store_true",
         help="Dry run: validate and re-tag existing MP3s, but skip new downloads.",
     )
+    parser.add_argument(
+        "-j",
+        "--download-workers",
+        type=int,
+        default=DOWNLOAD_WORKERS,
+        help=f"Number of songs to download and tag concurrently (default: {DOWNLOAD_WORKERS}).",
+    )
     args = parser.parse_args()
+    if args.download_workers < 1:
+        parser.error("--download-workers must be at least 1")
 
     # Default to 'NeuralCast' if not provided
     station = args.station or "NeuralCast"
 
-    list_playlists(station)
-    main(station, args.dry_run)  # pass dry-run flag
+    _buffer_redirected_stdout()
+
+    parsed_playlists = list_playlists(station)
+    # pass dry-run flag and the playlists already parsed for the listing
+    main(station, args.dry_run, args.download_workers, parsed_playlists)
@@ -1,8 +1,8 @@
 """Core data models used across the NeuralCast pipeline."""
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class Song(BaseModel):
@@ -12,12 +12,45 @@ class Song(BaseModel):
     album: Optional[str] = None
     validated: bool = False
     override_url: Optional[str] = None
+    # (artist, title, key) the cached key was computed from
+    _key_cache: Optional[Tuple[str, str, Tuple[str, str]]] = PrivateAttr(default=None)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Case/whitespace-insensitive (artist, title) key, normalized once per value."""
+        artist, title = self.artist, self.title
+        cached = self._key_cache
+        # Copies made with update= may carry a stale cache, so check its source
+        if cached is None or cached[0] is not artist or cached[1] is not title:
+            cached = (artist, title, (artist.lower().strip(), title.lower().strip()))
+            self._key_cache = cached
+        return cached[2]
 
 
 class Playlist(BaseModel):
     songs: List[Song]
 
 
+@dataclass(frozen=True, slots=True)
+class SongSnapshot:
+    """Immutable, slotted copy of the Song fields used by the repetition analysis."""
+
+    artist: str
+    title: str
+    year: str
+    # Case/whitespace-insensitive (artist, title) grouping key, computed once
+    key: Tuple[str, str]
+
+    @classmethod
+    def from_song(cls, song: Song) -> "SongSnapshot":
+        return cls(
+            song.artist,
+            song.title,
+            song.year,
+            song.key,
+        )
+
+
 @dataclass
 class ValidationResult:
     status: str
@@ -27,4 +60,4 @@ class ValidationResult:
     album_reason: Optional[str] = None
 
 
-__all__ = ["Song", "Playlist", "ValidationResult"]
+__all__ = ["Song", "SongSnapshot", "Playlist", "ValidationResult"]
@@ -1,10 +1,12 @@
 """Utilities for interacting with OpenAI APIs."""
 from __future__ import annotations
 
+import atexit
 import os
 import pathlib
 from typing import Optional
 
+import httpx
 import openai
 from dotenv import load_dotenv
 
@@ -16,6 +18,24 @@ _MODULE_DIR = pathlib.Path(__file__).resolve().parent
 _HOST_INSTRUCTIONS_PATH = _MODULE_DIR / "host_instructions_prompt.txt"
 
 
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_http_client() -> httpx.Client:
+    """Shared keep-alive transport so repeated TTS/text calls reuse one TLS session."""
+    http_client = openai.DefaultHttpxClient(
+        http2=_http2_available(),
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    )
+    atexit.register(http_client.close)
+    return http_client
+
+
 def get_openai_client() -> openai.OpenAI:
     if _OPENAI_KEY is None or not _OPENAI_KEY.strip():
         raise RuntimeError(
@@ -24,7 +44,9 @@ def get_openai_client() -> openai.OpenAI:
 
     global _OPENAI_CLIENT
     if _OPENAI_CLIENT is None:
-        _OPENAI_CLIENT = openai.OpenAI(api_key=_OPENAI_KEY)
+        _OPENAI_CLIENT = openai.OpenAI(
+            api_key=_OPENAI_KEY, http_client=_build_http_client()
+        )
     return _OPENAI_CLIENT
 
 
@@ -1,32 +1,172 @@
 """Playlist parsing and library management helpers."""
 from __future__ import annotations
 
+import csv
+import json
+import os
 import pathlib
 import re
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import is_not, itemgetter
+from typing import Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
 
-import pandas as pd
-from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3
 
 from models import Song
 
 DELETE_MARKER = "[DEL]"
-_YOUTUBE_HOST_FRAGMENTS = ("youtube.com", "youtu.be")
+TAG_CACHE_FILENAME = ".tagcache.json"
+# Suffix of in-progress downloads (see main._atomic_replace). yt-dlp needs the
+# staging name to end in .mp3, so library scans skip these explicitly; a file
+# left behind by a hard kill is never treated as a song.
+PARTIAL_MP3_SUFFIX = ".partial.mp3"
+PLAYLIST_SUMMARY_FILENAME = "playlist_summary.json"
+PLAYLIST_PARSE_WORKERS = 8
+# Text tags cached per MP3 (TagCache) and the ID3 frames they are read from
+_TEXT_TAG_FRAMES = {
+    "artist": "TPE1",
+    "title": "TIT2",
+    "date": "TDRC",
+    "album": "TALB",
+    "genre": "TCON",
+}
+_YOUTUBE_HOSTS = frozenset({"youtube.com", "youtu.be"})
 _OVERRIDE_PATTERN = re.compile(r"^\[(https?://[^\]]+)\]\s*(.*)$")
+# Path separators are replaced in a single str.translate pass
+_FILENAME_TRANSLATION = str.maketrans({"/": " ", "\\": " "})
 
 
-def _normalize_csv_value(value: object) -> Optional[str]:
-    if value is None:
-        return None
-    if isinstance(value, str):
-        text = value.strip()
-        if not text or text.lower() == "nan":
+@dataclass
+class TagCache:
+    """ID3 text tags per MP3 file name, valid while the file's mtime and size are unchanged."""
+
+    entries: Dict[str, dict]
+    dirty: bool = False
+
+    def get(self, file_name: str, mtime_ns: int, size: int) -> Optional[Dict[str, str]]:
+        entry = self.entries.get(file_name)
+        if not entry or entry.get("mtime_ns") != mtime_ns or entry.get("size") != size:
             return None
-        return text
-    if pd.isna(value):
+        tags = entry.get("tags")
+        return tags if isinstance(tags, dict) else None
+
+    def set(
+        self, file_name: str, mtime_ns: int, size: int, tags: Dict[str, str]
+    ) -> None:
+        entry = {"mtime_ns": mtime_ns, "size": size, "tags": tags}
+        if self.entries.get(file_name) == entry:
+            return
+        self.entries[file_name] = entry
+        self.dirty = True
+
+    def prune(self, keep: Set[str]) -> None:
+        stale = [name for name in self.entries if name not in keep]
+        for name in stale:
+            del self.entries[name]
+        if stale:
+            self.dirty = True
+
+
+def load_tag_cache(music_dir: pathlib.Path) -> TagCache:
+    path = music_dir / TAG_CACHE_FILENAME
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return TagCache(entries={})
+    except Exception as exc:  # noqa: BLE001
+        print(f"Warning: Ignoring unreadable tag cache {path}: {exc}")
+        return TagCache(entries={})
+    if not isinstance(data, dict):
+        return TagCache(entries={})
+    return TagCache(
+        entries={
+            name: entry
+            for name, entry in data.items()
+            if isinstance(name, str) and isinstance(entry, dict)
+        }
+    )
+
+
+def save_tag_cache(music_dir: pathlib.Path, cache: TagCache) -> None:
+    if not cache.dirty:
+        return
+    path = music_dir / TAG_CACHE_FILENAME
+    try:
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(cache.entries, handle, ensure_ascii=False, sort_keys=True)
+        cache.dirty = False
+    except OSError as exc:
+        print(f"Warning: Could not write tag cache {path}: {exc}")
+
+
+@dataclass
+class PlaylistTable:
+    """Raw playlist CSV contents: header order plus one dict per row.
+
+    Kept alongside the parsed songs so saving preserves any extra columns.
+    """
+
+    columns: List[str]
+    rows: List[Dict[str, str]]
+
+    @classmethod
+    def read(cls, playlist_path: pathlib.Path) -> "PlaylistTable":
+        with open(playlist_path, "r", encoding="utf-8-sig", newline="") as handle:
+            reader = csv.DictReader(handle)
+            rows = list(reader)
+            return cls(columns=list(reader.fieldnames or []), rows=rows)
+
+
+@dataclass
+class Mp3Listing:
+    """MP3 file names found in one directory scan.
+
+    ``contains_file`` matches exactly, and also accepts names that differ only
+    in case after confirming them with a stat, so case-insensitive filesystems
+    (macOS, Windows) still find files whose on-disk casing differs from the
+    playlist while case-sensitive ones keep exact matching.
+    """
+
+    directory: pathlib.Path
+    names: Set[str]
+    folded_names: Set[str]
+
+    def contains_file(self, file_name: str) -> bool:
+        if file_name in self.names:
+            return True
+        if file_name.casefold() not in self.folded_names:
+            return False
+        return os.path.isfile(os.path.join(self.directory, file_name))
+
+
+@dataclass(slots=True)
+class PlaylistEntry:
+    """Per-playlist state carried between the loading and processing passes."""
+
+    file: pathlib.Path
+    name: str
+    songs: List[Song]
+    needs_save: bool
+    deletions: List[Song]
+    table: PlaylistTable
+    removed_via_marker: int = 0
+    metadata_removed: int = 0
+
+
+def _normalize_str(text: Optional[str]) -> Optional[str]:
+    """Strip a CSV cell, mapping blanks and literal "nan" to None.
+
+    csv yields str cells (None only for fields missing from short rows), so
+    no type dispatch is needed.
+    """
+    if not text:
         return None
-    text = str(value).strip()
-    if not text or text.lower() == "nan":
+    text = text.strip()
+    if not text or (len(text) == 3 and text.lower() == "nan"):
         return None
     return text
 
@@ -40,6 +180,20 @@ def _strip_delete_prefix(value: Optional[str]) -> Tuple[Optional[str], bool]:
     return value, False
 
 
+def is_youtube_url(url: Optional[str]) -> bool:
+    """Return True when ``url``'s host is YouTube (including subdomains)."""
+    if not url:
+        return False
+    try:
+        host = (urlparse(url).hostname or "").lower()
+    except ValueError:
+        return False
+    if host in _YOUTUBE_HOSTS:
+        return True
+    _, _, parent = host.partition(".")
+    return parent in _YOUTUBE_HOSTS
+
+
 def _extract_override(value: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
     if value is None:
         return None, None
@@ -48,8 +202,7 @@ def _extract_override(value: Optional[str]) -> Tuple[Optional[str], Optional[str
         return value, None
 
     url = match.group(1).strip()
-    normalized_url = url.lower()
-    if not any(host in normalized_url for host in _YOUTUBE_HOST_FRAGMENTS):
+    if not is_youtube_url(url):
         return value, None
 
     remainder = match.group(2).strip()
@@ -69,72 +222,124 @@ def _as_bool(value: object) -> bool:
     return False
 
 
+# Artists repeat across a playlist and every song is resolved more than once
+# per run, so the sanitized components are memoized.
+@lru_cache(maxsize=4096)
 def sanitize_filename_component(value: str) -> str:
-    return value.replace("/", " ").replace("\\", " ").strip()
+    return value.translate(_FILENAME_TRANSLATION).strip()
+
+
+def mp3_filename(artist: str, title: str) -> str:
+    """Return the library filename (``Artist - Title.mp3``) for a song."""
+    return (
+        f"{sanitize_filename_component(artist)} - "
+        f"{sanitize_filename_component(title)}.mp3"
+    )
+
+
+def read_text_tags(path: Union[str, pathlib.Path]) -> Dict[str, str]:
+    """Return the first value of each cached text tag, "" when unset.
+
+    Frames are read straight from the ID3 tag rather than through EasyID3's
+    key-translation layer, which builds a list per lookup.
+    """
+    id3 = ID3(str(path))
+    tags: Dict[str, str] = {}
+    for key, frame_id in _TEXT_TAG_FRAMES.items():
+        frame = id3.get(frame_id)
+        if frame is None:
+            tags[key] = ""
+            continue
+        # TCON.genres resolves numeric ID3v1 genre references like EasyID3 does
+        values = frame.genres if frame_id == "TCON" else frame.text
+        tags[key] = str(values[0]) if values else ""
+    return tags
+
+
+def existing_mp3_names(directory: Union[str, pathlib.Path]) -> Mp3Listing:
+    """Return the MP3 files in ``directory`` from one directory scan."""
+    names: Set[str] = set()
+    folded_names: Set[str] = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                folded = entry.name.casefold()
+                if (
+                    folded.endswith(".mp3")
+                    and not folded.endswith(PARTIAL_MP3_SUFFIX)
+                    and entry.is_file()
+                ):
+                    folded_names.add(folded)
+                    if entry.name.endswith(".mp3"):
+                        names.add(entry.name)
+    except FileNotFoundError:
+        pass
+    return Mp3Listing(pathlib.Path(directory), names, folded_names)
 
 
 def playlist_song_key(song: Song) -> Tuple[str, str]:
-    return (song.artist.lower().strip(), song.title.lower().strip())
+    return song.key
+
+
+def _playlist_fingerprint(playlist_path: pathlib.Path) -> Tuple[str, int, int]:
+    stat = os.stat(playlist_path)
+    return (os.path.abspath(playlist_path), stat.st_mtime_ns, stat.st_size)
+
+
+# (songs, needs_save, marked_for_deletion, table) as returned by load_playlist
+ParsedPlaylist = Tuple[List[Song], bool, List[Song], PlaylistTable]
 
 
 def load_playlist(
     playlist_path: pathlib.Path,
-) -> Tuple[List[Song], bool, List[Song], pd.DataFrame]:
-    df = pd.read_csv(
-        playlist_path,
-        dtype={
-            "Year": "string",
-            "Artist": "string",
-            "Title": "string",
-            "Album": "string",
-        },
-        keep_default_na=False,
-        na_filter=False,
-    )
+    preparsed: Optional[Dict[Tuple[str, int, int], ParsedPlaylist]] = None,
+) -> ParsedPlaylist:
+    """Parse a playlist CSV, reusing a parse from ``playlist_song_counts``.
+
+    ``preparsed`` entries are keyed by file fingerprint, so an edited file is
+    parsed again. A reused entry is popped because callers mutate it.
+    """
+    if preparsed:
+        parsed = preparsed.pop(_playlist_fingerprint(playlist_path), None)
+        if parsed is not None:
+            return parsed
+    return _parse_playlist(playlist_path)
+
+
+def _parse_playlist(playlist_path: pathlib.Path) -> ParsedPlaylist:
+    table = PlaylistTable.read(playlist_path)
 
     needs_save = False
-    if not any(col.lower() == "validated" for col in df.columns):
-        df["Validated"] = False
+    if not any(col.lower() == "validated" for col in table.columns):
+        table.columns.append("Validated")
+        for row in table.rows:
+            row["Validated"] = "False"
         needs_save = True
         print(f"Added 'Validated' column to {playlist_path}")
 
-    column_lookup = {col.lower(): col for col in df.columns}
+    column_lookup = {col.lower(): col for col in table.columns}
+    # Resolve each column's header once instead of probing the lookup per row
+    artist_col = column_lookup.get("artist")
+    title_col = column_lookup.get("title")
+    year_col = column_lookup.get("year")
+    album_col = column_lookup.get("album")
+    validated_col = column_lookup.get("validated")
 
     songs: List[Song] = []
     marked_for_deletion: List[Song] = []
 
-    for _, row in df.iterrows():
-        artist_raw = (
-            _normalize_csv_value(row[column_lookup["artist"]])
-            if "artist" in column_lookup
-            else None
-        )
-        title_raw = (
-            _normalize_csv_value(row[column_lookup["title"]])
-            if "title" in column_lookup
-            else None
-        )
-        year = (
-            _normalize_csv_value(row[column_lookup["year"]])
-            if "year" in column_lookup
-            else None
-        )
-        album_raw = (
-            _normalize_csv_value(row[column_lookup["album"]])
-            if "album" in column_lookup
-            else None
-        )
+    for row in table.rows:
+        artist_raw = _normalize_str(row[artist_col]) if artist_col else None
+        title_raw = _normalize_str(row[title_col]) if title_col else None
+        year = _normalize_str(row[year_col]) if year_col else None
+        album_raw = _normalize_str(row[album_col]) if album_col else None
 
         artist_without_override, override_url = _extract_override(artist_raw)
         artist, artist_marked = _strip_delete_prefix(artist_without_override)
         title, title_marked = _strip_delete_prefix(title_raw)
         album, _ = _strip_delete_prefix(album_raw)
 
-        validated_raw = (
-            row[column_lookup["validated"]]
-            if "validated" in column_lookup
-            else False
-        )
+        validated_raw = row[validated_col] if validated_col else False
         validated = _as_bool(validated_raw) if validated_raw is not None else False
 
         if artist_marked or title_marked:
@@ -171,7 +376,94 @@ def load_playlist(
                 f"Warning: Skipping incomplete row in {playlist_path}: Artist={artist}, Title={title}, Year={year}"
             )
 
-    return songs, needs_save, marked_for_deletion, df
+    return songs, needs_save, marked_for_deletion, table
+
+
+def _playlist_summary_path(playlists_dir: pathlib.Path) -> pathlib.Path:
+    return playlists_dir.parent / "metadata" / PLAYLIST_SUMMARY_FILENAME
+
+
+def playlist_song_counts(
+    playlist_files: List[pathlib.Path],
+) -> Tuple[
+    Dict[pathlib.Path, Dict[str, int]], Dict[Tuple[str, int, int], ParsedPlaylist]
+]:
+    """Return ``{"songs": n, "validated": n}`` per playlist CSV, plus the parses.
+
+    Counts are kept in a sidecar in the station's ``metadata`` folder keyed by
+    each CSV's mtime and size, so unchanged playlists are not parsed again.
+    Playlists that did need parsing are returned keyed by file fingerprint so
+    the caller can hand them to ``load_playlist`` instead of parsing twice.
+    """
+    if not playlist_files:
+        return {}, {}
+
+    summary_path = _playlist_summary_path(playlist_files[0].parent)
+    try:
+        with summary_path.open("r", encoding="utf-8") as handle:
+            cached = json.load(handle)
+        if not isinstance(cached, dict):
+            cached = {}
+    except FileNotFoundError:
+        cached = {}
+    except Exception as exc:  # noqa: BLE001
+        print(f"Warning: Ignoring unreadable playlist summary {summary_path}: {exc}")
+        cached = {}
+
+    stats = {playlist_file: playlist_file.stat() for playlist_file in playlist_files}
+
+    def _is_fresh(playlist_file: pathlib.Path) -> bool:
+        entry = cached.get(playlist_file.name)
+        stat = stats[playlist_file]
+        return (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            # A hand-edited or older-format entry is reparsed, not trusted
+            and isinstance(entry.get("songs"), int)
+            and isinstance(entry.get("validated"), int)
+        )
+
+    # Stale playlists are parsed concurrently so their reads overlap
+    stale_files = [f for f in playlist_files if not _is_fresh(f)]
+    parsed_by_file = {}
+    if stale_files:
+        with ThreadPoolExecutor(
+            max_workers=min(PLAYLIST_PARSE_WORKERS, len(stale_files))
+        ) as executor:
+            parsed_by_file = dict(
+                zip(stale_files, executor.map(_parse_playlist, stale_files))
+            )
+
+    counts: Dict[pathlib.Path, Dict[str, int]] = {}
+    parsed_playlists: Dict[Tuple[str, int, int], ParsedPlaylist] = {}
+    entries: Dict[str, dict] = {}
+    for playlist_file in playlist_files:
+        stat = stats[playlist_file]
+        parsed = parsed_by_file.get(playlist_file)
+        if parsed is None:
+            entry = cached[playlist_file.name]
+        else:
+            parsed_playlists[_playlist_fingerprint(playlist_file)] = parsed
+            songs = parsed[0]
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "songs": len(songs),
+                "validated": sum(1 for song in songs if song.validated),
+            }
+        entries[playlist_file.name] = entry
+        counts[playlist_file] = {"songs": entry["songs"], "validated": entry["validated"]}
+
+    if parsed_by_file or len(entries) != len(cached):
+        try:
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            with summary_path.open("w", encoding="utf-8") as handle:
+                json.dump(entries, handle, ensure_ascii=False, indent=2, sort_keys=True)
+        except OSError as exc:
+            print(f"Warning: Could not write playlist summary {summary_path}: {exc}")
+
+    return counts, parsed_playlists
 
 
 def backfill_songs_from_library(
@@ -193,20 +485,41 @@ def backfill_songs_from_library(
     updated_songs = list(songs)
     added_from_files = 0
     changes = False
-
-    for mp3_file in music_dir.glob("*.mp3"):
+    # Re-reading every ID3 header on each run dominates this scan; reuse the
+    # tags from the previous run for files whose mtime has not changed.
+    tag_cache = load_tag_cache(music_dir)
+    scanned_files: Set[str] = set()
+
+    # One scandir pass; a Path is only built for files that are renamed or added
+    with os.scandir(music_dir) as dir_entries:
+        mp3_entries = [
+            entry
+            for entry in dir_entries
+            if entry.name.endswith(".mp3")
+            and not entry.name.endswith(PARTIAL_MP3_SUFFIX)
+            and entry.is_file()
+        ]
+
+    for entry in mp3_entries:
+        file_name = entry.name
         try:
-            audio = EasyID3(str(mp3_file))
-            file_artist = audio.get("artist", [""])[0] if audio.get("artist") else ""
-            file_title = audio.get("title", [""])[0] if audio.get("title") else ""
-            file_year = audio.get("date", [""])[0] if audio.get("date") else ""
-            file_album = audio.get("album", [""])[0] if audio.get("album") else ""
+            file_stat = entry.stat()
+            mtime_ns, size = file_stat.st_mtime_ns, file_stat.st_size
+            tags = tag_cache.get(file_name, mtime_ns, size)
+            if tags is None:
+                tags = read_text_tags(entry.path)
+                tag_cache.set(file_name, mtime_ns, size, tags)
+            scanned_files.add(file_name)
+            file_artist = tags.get("artist", "")
+            file_title = tags.get("title", "")
+            file_year = tags.get("date", "")
+            file_album = tags.get("album", "")
         except Exception as exc:
-            print(f"Warning: Could not read metadata from {mp3_file}: {exc}")
+            print(f"Warning: Could not read metadata from {entry.path}: {exc}")
             continue
 
         if not file_artist or not file_title:
-            filename = mp3_file.stem
+            filename = file_name[: -len(".mp3")]
             if " - " in filename:
                 parts = filename.split(" - ", 1)
                 file_artist = file_artist or parts[0].strip()
@@ -219,23 +532,23 @@ def backfill_songs_from_library(
         if key in songs_by_key:
             continue
 
-        safe_artist = sanitize_filename_component(file_artist)
-        safe_title = sanitize_filename_component(file_title)
-        expected_name = f"{safe_artist} - {safe_title}.mp3"
-        target_path = mp3_file.with_name(expected_name)
-        if mp3_file.name != expected_name:
+        expected_name = mp3_filename(file_artist, file_title)
+        if file_name != expected_name:
+            target_path = music_dir / expected_name
             try:
                 if target_path.exists():
                     print(
-                        f"Warning: Target exists, cannot rename {mp3_file.name} -> {expected_name}"
+                        f"Warning: Target exists, cannot rename {file_name} -> {expected_name}"
                     )
                 else:
-                    mp3_file.rename(target_path)
-                    mp3_file = target_path
-                    print(f"Renamed file: {target_path.name}")
+                    os.rename(entry.path, target_path)
+                    scanned_files.discard(file_name)
+                    scanned_files.add(expected_name)
+                    tag_cache.set(expected_name, mtime_ns, size, tags)
+                    print(f"Renamed file: {expected_name}")
                     changes = True
             except Exception as exc:
-                print(f"Warning: Could not rename {mp3_file.name} -> {expected_name}: {exc}")
+                print(f"Warning: Could not rename {file_name} -> {expected_name}: {exc}")
 
         year_to_use = file_year if file_year else "Unknown"
         new_song = Song(
@@ -251,6 +564,9 @@ def backfill_songs_from_library(
         changes = True
         print(f"Added from existing file: {file_artist} - {file_title}")
 
+    tag_cache.prune(scanned_files)
+    save_tag_cache(music_dir, tag_cache)
+
     if added_from_files > 0:
         print(f"Added {added_from_files} song(s) from existing MP3 files")
 
@@ -258,85 +574,97 @@ def backfill_songs_from_library(
 
 
 def deduplicate_and_sort_songs(songs: List[Song]) -> Tuple[List[Song], bool, int]:
-    seen: Dict[Tuple[str, str], Song] = {}
-    ordered_unique: List[Song] = []
+    # Normalize each song's key once and reuse it for both dedup and sorting;
+    # setdefault keeps the first occurrence of every key.
+    unique_by_key: Dict[Tuple[str, str], Song] = {}
     for song in songs:
-        key = playlist_song_key(song)
-        if key not in seen:
-            seen[key] = song
-            ordered_unique.append(song)
-
-    duplicates_removed = len(songs) - len(ordered_unique)
-    sorted_songs = sorted(
-        ordered_unique, key=lambda s: (s.artist.lower().strip(), s.title.lower().strip())
-    )
-    changed = duplicates_removed > 0 or sorted_songs != songs
+        unique_by_key.setdefault(playlist_song_key(song), song)
+
+    duplicates_removed = len(songs) - len(unique_by_key)
+    sorted_songs = [
+        song for _, song in sorted(unique_by_key.items(), key=itemgetter(0))
+    ]
+    # Sorting never copies songs, so identity is enough to detect a reorder
+    changed = duplicates_removed > 0 or any(map(is_not, sorted_songs, songs))
     return sorted_songs, changed, duplicates_removed
 
 
-def replace_song_entry(songs: List[Song], updated_song: Song) -> None:
+def index_songs(songs: List[Song]) -> Dict[Tuple[str, str], int]:
+    return {playlist_song_key(song): idx for idx, song in enumerate(songs)}
+
+
+def replace_song_entry(
+    songs: List[Song],
+    updated_song: Song,
+    index: Optional[Dict[Tuple[str, str], int]] = None,
+) -> None:
     target_key = playlist_song_key(updated_song)
+    if index is not None:
+        idx = index.get(target_key)
+        if idx is not None:
+            songs[idx] = updated_song
+        return
+
     for idx, existing in enumerate(songs):
         if playlist_song_key(existing) == target_key:
             songs[idx] = updated_song
             return
 
 
+def _song_row_values(song: Song) -> Dict[str, object]:
+    return {
+        "Artist": (
+            f"[{song.override_url}] {song.artist}".strip()
+            if song.override_url
+            else song.artist
+        ),
+        "Title": song.title,
+        "Year": str(song.year).strip() if song.year else "",
+        "Album": song.album or "",
+        "Validated": bool(song.validated),
+    }
+
+
 def save_playlist_with_validation(
-    playlist_path: pathlib.Path, songs: List[Song], df: pd.DataFrame
+    playlist_path: pathlib.Path, songs: List[Song], table: PlaylistTable
 ):
-    # Update only the standard columns in the DataFrame, keep all others
-    # Build a DataFrame from songs for standard columns
-    std_cols = ["Artist", "Title", "Year", "Album", "Validated"]
-    song_keys = set((s.artist, s.title, s.year, s.album) for s in songs)
-    # Build a lookup for quick update
-    song_map = {}
-    for song in songs:
-        key = (song.artist, song.title)
-        song_map[key] = song
+    # Update only the standard columns in the table, keep all others.
+    # Each song's standard column values are formatted once up front.
+    row_values_by_key = {
+        (song.artist, song.title): _song_row_values(song) for song in songs
+    }
 
-    # Update rows in df for songs present, drop rows not in songs, and add new rows if needed
+    # Update rows in the table for songs present, drop rows not in songs, and add new rows if needed
     updated_rows = []
     seen_keys = set()
-    for idx, row in df.iterrows():
-        artist = str(row.get("Artist", "")).strip()
-        title = str(row.get("Title", "")).strip()
+    for row in table.rows:
+        artist = str(row.get("Artist") or "").strip()
+        title = str(row.get("Title") or "").strip()
         key = (artist, title)
-        song = song_map.get(key)
-        if song:
-            # Update standard columns
-            row["Artist"] = (
-                f"[{song.override_url}] {song.artist}".strip()
-                if song.override_url
-                else song.artist
-            )
-            row["Title"] = song.title
-            row["Year"] = str(song.year).strip() if song.year else ""
-            row["Album"] = song.album or ""
-            row["Validated"] = bool(song.validated)
-            updated_rows.append(row.to_dict())
+        values = row_values_by_key.get(key)
+        if values:
+            row_dict = dict(row)
+            row_dict.update(values)
+            updated_rows.append(row_dict)
             seen_keys.add(key)
         # else: row is not in songs anymore (e.g. deleted), so skip
 
-    # Add any new songs not present in df
-    for song in songs:
-        key = (song.artist, song.title)
+    # Add any new songs not present in the table
+    for key, values in row_values_by_key.items():
         if key not in seen_keys:
-            new_row = {col: "" for col in df.columns}
-            new_row["Artist"] = (
-                f"[{song.override_url}] {song.artist}".strip()
-                if song.override_url
-                else song.artist
-            )
-            new_row["Title"] = song.title
-            new_row["Year"] = str(song.year).strip() if song.year else ""
-            new_row["Album"] = song.album or ""
-            new_row["Validated"] = bool(song.validated)
-            updated_rows.append({col: new_row.get(col, "") for col in df.columns})
-
-    # Create new DataFrame with all columns preserved
-    new_df = pd.DataFrame(updated_rows, columns=df.columns)
-    new_df.to_csv(playlist_path, index=False)
+            new_row = {col: "" for col in table.columns}
+            new_row.update(values)
+            updated_rows.append(new_row)
+
+    with open(playlist_path, "w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(
+            handle,
+            fieldnames=table.columns,
+            extrasaction="ignore",
+            lineterminator="\n",
+        )
+        writer.writeheader()
+        writer.writerows(updated_rows)
     print(f"Cleaned and sorted playlist saved to {playlist_path}")
 
 
@@ -350,26 +678,27 @@ def delete_marked_mp3_files(
         print("Warning: Songs directory does not exist; cannot delete marked MP3 files")
         return 0
 
+    # Compute the target file names once, then intersect them with one
+    # directory listing per playlist instead of a stat per target per playlist
+    target_names = {
+        mp3_filename(song.artist, song.title) for song in delete_targets.values()
+    }
     removed = 0
-    for playlist_dir in songs_root.iterdir():
-        if not playlist_dir.is_dir():
-            continue
-
-        for song in delete_targets.values():
-            safe_artist = sanitize_filename_component(song.artist)
-            safe_title = sanitize_filename_component(song.title)
-            target_file = playlist_dir / f"{safe_artist} - {safe_title}.mp3"
-            if not target_file.exists():
-                continue
+    with os.scandir(songs_root) as root_entries:
+        playlist_dirs = [entry for entry in root_entries if entry.is_dir()]
 
+    for playlist_dir in playlist_dirs:
+        listing = existing_mp3_names(playlist_dir.path)
+        if not listing.folded_names:
+            continue
+        for file_name in sorted(filter(listing.contains_file, target_names)):
+            target_file = pathlib.Path(playlist_dir.path, file_name)
             try:
                 target_file.unlink()
                 removed += 1
-                try:
-                    relative_path = target_file.relative_to(songs_root)
-                except ValueError:
-                    relative_path = target_file
-                print(f"🗑️ Deleted MP3 due to [DEL]: {relative_path}")
+                print(
+                    f"🗑️ Deleted MP3 due to [DEL]: {pathlib.Path(playlist_dir.name, file_name)}"
+                )
             except Exception as exc:
                 print(f"❌ Failed to delete MP3 {target_file}: {exc}")
 
@@ -378,12 +707,25 @@ def delete_marked_mp3_files(
 
 __all__ = [
     "DELETE_MARKER",
+    "PARTIAL_MP3_SUFFIX",
+    "PlaylistEntry",
+    "PlaylistTable",
     "load_playlist",
+    "playlist_song_counts",
     "backfill_songs_from_library",
     "deduplicate_and_sort_songs",
+    "index_songs",
+    "is_youtube_url",
     "replace_song_entry",
     "save_playlist_with_validation",
     "delete_marked_mp3_files",
     "sanitize_filename_component",
+    "mp3_filename",
+    "existing_mp3_names",
+    "Mp3Listing",
+    "read_text_tags",
     "playlist_song_key",
+    "TagCache",
+    "load_tag_cache",
+    "save_tag_cache",
 ]
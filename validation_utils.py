@@ -1,29 +1,48 @@
 """Helpers for validating songs and albums."""
 from __future__ import annotations
 
+import atexit
 import difflib
 import os
+import pathlib
+import shelve
+import threading
+import time
 import urllib.parse
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import dotenv
 import musicbrainzngs
 import requests
 import spotipy
 from requests import Session
+from requests.adapters import HTTPAdapter
 from spotipy.oauth2 import SpotifyClientCredentials
 
 from models import Song, ValidationResult
 
+try:  # POSIX only; used to keep concurrent runs off the shared validation cache
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 # Load environment variables from .env file
 # Keeping this here avoids requiring callers to import dotenv themselves.
 dotenv.load_dotenv()
 
 musicbrainzngs.set_useragent("NeuralCast", "0.1", "you@example.com")
 
+# Validation runs on a thread pool in main; size the connection pool so every
+# worker can keep its own keep-alive connection instead of churning sockets.
+_HTTP_POOL_SIZE = 16
+
 SESSION: Session = requests.Session()
 SESSION.headers.update({"User-Agent": "NeuralCast/1.0"})
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE),
+)
 _REQUEST_TIMEOUT = 10
 
 _SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
@@ -44,6 +63,35 @@ except Exception:
     _SPOTIFY_CLIENT = None
 
 
+# Providers report failures (network errors, rate limits) as "not found".
+# Answered and failed lookups are counted per thread so negative outcomes can
+# tell a real "not found" from an outage.
+_provider_tally = threading.local()
+
+
+def _note_provider_answer() -> None:
+    _provider_tally.answered = getattr(_provider_tally, "answered", 0) + 1
+
+
+def _note_provider_failure() -> None:
+    _provider_tally.failed = getattr(_provider_tally, "failed", 0) + 1
+
+
+def _take_provider_tally() -> Tuple[int, int]:
+    """Return and reset this thread's (answered, failed) provider lookup counts."""
+    tally = (
+        getattr(_provider_tally, "answered", 0),
+        getattr(_provider_tally, "failed", 0),
+    )
+    _provider_tally.answered = _provider_tally.failed = 0
+    return tally
+
+
+def _all_providers_answered() -> bool:
+    answered, failed = _take_provider_tally()
+    return answered > 0 and failed == 0
+
+
 def _close_enough(a: str, b: str) -> bool:
     return difflib.SequenceMatcher(None, a.lower(), b.lower()).ratio() > 0.7
 
@@ -57,9 +105,12 @@ def _itunes_lookup(term: str) -> Optional[dict]:
     try:
         response = SESSION.get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
     except Exception:
+        _note_provider_failure()
         return None
+    _note_provider_answer()
+    return data
 
 
 def _ensure_spotify_client() -> Optional[spotipy.Spotify]:
@@ -68,9 +119,12 @@ def _ensure_spotify_client() -> Optional[spotipy.Spotify]:
 
 def _musicbrainz_search(query: str, limit: int = 1) -> Optional[dict]:
     try:
-        return musicbrainzngs.search_recordings(query=query, limit=limit)
+        result = musicbrainzngs.search_recordings(query=query, limit=limit)
     except Exception:
+        _note_provider_failure()
         return None
+    _note_provider_answer()
+    return result
 
 
 def _mb_recording_found(result: Optional[dict]) -> bool:
@@ -92,8 +146,10 @@ def spotify_ok(artist: str, title: str) -> bool:
 
     try:
         res = client.search(q=f'artist:"{artist}" track:"{title}"', type="track", limit=1)
+        _note_provider_answer()
         return res.get("tracks", {}).get("total", 0) > 0
     except Exception:
+        _note_provider_failure()
         return False
 
 
@@ -155,11 +211,13 @@ def spotify_album_ok(artist: str, title: str, album: str) -> bool:
             type="track",
             limit=1,
         )
+        _note_provider_answer()
         if res.get("tracks", {}).get("total", 0) == 0:
             return False
         item = res["tracks"]["items"][0]
         return _close_enough(item.get("album", {}).get("name", ""), album)
     except Exception:
+        _note_provider_failure()
         return False
 
 
@@ -266,56 +324,169 @@ def validate_album_field(artist: str, title: str, album: Optional[str]) -> dict:
     }
 
 
+# Lookup outcomes per casefolded (artist, title, album), shared by every
+# playlist in a run. Values are (song_verified, album_status) where
+# album_status is None (no album), "valid" or "not_validated"; transient
+# "validation_error" outcomes are not memoized.
+_VALIDATION_MEMO: Dict[Tuple[str, str, str], Tuple[bool, Optional[str]]] = {}
+
+# Outcomes also persist across runs so unchanged songs skip the providers.
+# Negative outcomes expire sooner: a track that is missing today may be
+# listed by a provider next week.
+VALIDATION_CACHE_PATH = pathlib.Path(__file__).parent / ".validation_cache"
+VALIDATION_CACHE_TTL = 30 * 24 * 60 * 60
+NEGATIVE_VALIDATION_CACHE_TTL = 7 * 24 * 60 * 60
+
+_validation_shelf: Optional[shelve.Shelf] = None
+_validation_shelf_failed = False
+# shelve is not thread-safe and validation runs on a thread pool
+_validation_shelf_lock = threading.Lock()
+
+
+def _get_validation_shelf() -> Optional[shelve.Shelf]:
+    """Open the persistent validation cache on first use (call with the lock held).
+
+    dbm files are not safe for concurrent writers, so the run holds an
+    exclusive lock file for as long as the shelf is open. A second run (e.g.
+    another station at the same time) falls back to memory only. Without
+    fcntl (Windows) there is no lock, so runs there must not overlap.
+    """
+    global _validation_shelf, _validation_shelf_failed
+    if _validation_shelf is not None or _validation_shelf_failed:
+        return _validation_shelf
+
+    lock_handle = None
+    try:
+        lock_handle = open(f"{VALIDATION_CACHE_PATH}.lock", "a")
+        if fcntl is not None:
+            fcntl.flock(lock_handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        shelf = shelve.open(str(VALIDATION_CACHE_PATH))
+    except BlockingIOError:
+        print("Warning: Validation cache is in use by another run; using memory only")
+    except Exception as exc:  # noqa: BLE001
+        print(f"Warning: Validation cache unavailable ({exc}); using memory only")
+    else:
+
+        def _close() -> None:
+            shelf.close()
+            lock_handle.close()  # releases the lock
+
+        atexit.register(_close)
+        _validation_shelf = shelf
+        return shelf
+
+    if lock_handle is not None:
+        lock_handle.close()
+    _validation_shelf_failed = True
+    return None
+
+
+def _load_cached_outcome(
+    shelf_key: str,
+) -> Optional[Tuple[bool, Optional[str]]]:
+    with _validation_shelf_lock:
+        shelf = _get_validation_shelf()
+        if shelf is None:
+            return None
+        try:
+            song_ok, album_status, stored_at = shelf[shelf_key]
+        except KeyError:
+            return None
+        except Exception:  # noqa: BLE001 - unreadable entry, revalidate
+            return None
+    negative = not song_ok or album_status == "not_validated"
+    ttl = NEGATIVE_VALIDATION_CACHE_TTL if negative else VALIDATION_CACHE_TTL
+    if time.time() - stored_at > ttl:
+        return None
+    return song_ok, album_status
+
+
+def _store_cached_outcome(shelf_key: str, outcome: Tuple[bool, Optional[str]]) -> None:
+    with _validation_shelf_lock:
+        shelf = _get_validation_shelf()
+        if shelf is None:
+            return
+        try:
+            shelf[shelf_key] = (*outcome, time.time())
+        except Exception as exc:  # noqa: BLE001
+            print(f"Warning: Could not update validation cache: {exc}")
+
+
+def _validation_outcome(song: Song, album_value: str) -> Tuple[bool, Optional[str]]:
+    memo_key = (
+        _norm(song.artist).casefold(),
+        _norm(song.title).casefold(),
+        album_value.casefold(),
+    )
+    outcome = _VALIDATION_MEMO.get(memo_key)
+    if outcome is not None:
+        return outcome
+
+    shelf_key = "\x1f".join(memo_key)
+    outcome = _load_cached_outcome(shelf_key)
+    if outcome is not None:
+        _VALIDATION_MEMO[memo_key] = outcome
+        return outcome
+
+    # Negative outcomes are only persisted when every provider consulted for
+    # the check answered; otherwise a (partial) outage would be trusted as
+    # "not found" for days. Lookups answered from the lru_caches are not
+    # counted, which errs on the side of not persisting.
+    _take_provider_tally()
+    if not verified(song.artist, song.title):
+        outcome = (False, None)
+        persist = _all_providers_answered()
+    elif not album_value:
+        outcome = (True, None)
+        persist = True
+    else:
+        _take_provider_tally()
+        try:
+            album_ok = verified_album(song.artist, song.title, album_value)
+        except Exception:
+            return True, "validation_error"
+        outcome = (True, "valid" if album_ok else "not_validated")
+        persist = album_ok or _all_providers_answered()
+
+    _VALIDATION_MEMO[memo_key] = outcome
+    if persist:
+        _store_cached_outcome(shelf_key, outcome)
+    return outcome
+
+
 def perform_song_validation(
     song: Song, playlist_name: str, invalid_albums: List[dict]
 ) -> ValidationResult:
-    if not verified(song.artist, song.title):
+    album_value = (song.album or "").strip() if song.album else ""
+    song_ok, album_status = _validation_outcome(song, album_value)
+    if not song_ok:
         return ValidationResult(status="song_invalid", song=None)
 
-    album_value = (song.album or "").strip() if song.album else ""
-    if album_value:
-        try:
-            if verified_album(song.artist, song.title, album_value):
-                return ValidationResult(
-                    status="valid",
-                    song=song.copy(update={"validated": True}),
-                    album=album_value,
-                    album_validated=True,
-                )
-
-            invalid_albums.append(
-                {
-                    "Artist": song.artist,
-                    "Title": song.title,
-                    "Album": album_value,
-                    "Playlist": playlist_name,
-                    "Reason": "not_validated",
-                }
-            )
-            return ValidationResult(
-                status="album_failed",
-                song=None,
-                album=album_value,
-                album_validated=False,
-                album_reason="not_validated",
-            )
-        except Exception:
-            invalid_albums.append(
-                {
-                    "Artist": song.artist,
-                    "Title": song.title,
-                    "Album": album_value,
-                    "Playlist": playlist_name,
-                    "Reason": "validation_error",
-                }
-            )
-            return ValidationResult(
-                status="album_failed",
-                song=None,
-                album=album_value,
-                album_validated=False,
-                album_reason="validation_error",
-            )
+    if album_status == "valid":
+        return ValidationResult(
+            status="valid",
+            song=song.copy(update={"validated": True}),
+            album=album_value,
+            album_validated=True,
+        )
+
+    if album_status is not None:
+        invalid_albums.append(
+            {
+                "Artist": song.artist,
+                "Title": song.title,
+                "Album": album_value,
+                "Playlist": playlist_name,
+                "Reason": album_status,
+            }
+        )
+        return ValidationResult(
+            status="album_failed",
+            song=None,
+            album=album_value,
+            album_validated=False,
+            album_reason=album_status,
+        )
 
     return ValidationResult(
         status="valid",